@@ -9,6 +9,8 @@ class ProjectAdmin(admin.ModelAdmin):
     search_fields = ['project_name', 'project_description', 'project_owner__username']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['-created_at']
+    list_select_related = ['project_owner']
+    autocomplete_fields = ['project_owner']
 
 
 @admin.register(Bug)
@@ -18,6 +20,8 @@ class BugAdmin(admin.ModelAdmin):
     search_fields = ['bug_title', 'bug_description', 'assigned_to_user__username', 'created_by_user__username']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['-created_at']
+    list_select_related = ['assigned_to_user', 'created_by_user', 'related_project__project_owner']
+    autocomplete_fields = ['assigned_to_user', 'created_by_user', 'related_project']
     
     fieldsets = (
         ('Bug Information', {
@@ -40,6 +44,8 @@ class CommentAdmin(admin.ModelAdmin):
     search_fields = ['comment_message', 'commenter_user__username', 'related_bug__bug_title']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['-created_at']
+    list_select_related = ['commenter_user', 'related_bug__related_project']
+    autocomplete_fields = ['related_bug', 'commenter_user']
     
     def comment_message_preview(self, obj):
         """Show preview of comment message in admin list"""
@@ -54,6 +60,8 @@ class ActivityLogAdmin(admin.ModelAdmin):
     search_fields = ['activity_description', 'activity_user__username', 'related_project__project_name']
     readonly_fields = ['created_at']
     ordering = ['-created_at']
+    list_select_related = ['activity_user', 'related_project__project_owner', 'related_bug__related_project']
+    autocomplete_fields = ['activity_user', 'related_project', 'related_bug']
     
     fieldsets = (
         ('Activity Information', {
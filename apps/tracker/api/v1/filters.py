@@ -0,0 +1,45 @@
+"""
+Version 1 filtersets for the tracker application.
+Contains the FilterSet classes used by the API v1 viewsets.
+"""
+
+import django_filters
+from ...models import Bug, Comment, ActivityLog
+
+
+class BugFilterSet(django_filters.FilterSet):
+    """
+    Filters for bug endpoints.
+    
+    status, project and assigned_to are the short query parameter names the
+    bug list has always accepted, kept as aliases of the model field filters.
+    """
+    status = django_filters.ChoiceFilter(field_name='bug_status', choices=Bug.STATUS_CHOICES)
+    project = django_filters.NumberFilter(field_name='related_project_id')
+    assigned_to = django_filters.NumberFilter(field_name='assigned_to_user_id')
+    
+    class Meta:
+        model = Bug
+        fields = ['bug_status', 'bug_priority', 'related_project', 'assigned_to_user']
+
+
+class CommentFilterSet(django_filters.FilterSet):
+    """
+    Filters for comment endpoints, with bug as a short alias of related_bug.
+    """
+    bug = django_filters.NumberFilter(field_name='related_bug_id')
+    
+    class Meta:
+        model = Comment
+        fields = ['related_bug']
+
+
+class ActivityLogFilterSet(django_filters.FilterSet):
+    """
+    Filters for activity log endpoints, with project as a short alias of related_project.
+    """
+    project = django_filters.NumberFilter(field_name='related_project_id')
+    
+    class Meta:
+        model = ActivityLog
+        fields = ['activity_type', 'related_project', 'related_bug']
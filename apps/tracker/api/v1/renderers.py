@@ -0,0 +1,43 @@
+"""
+Version 1 renderers for the tracker application.
+Contains the orjson-backed JSON renderer used by the API v1 endpoints.
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+import orjson
+
+# Types orjson does not know (lazy translations, Decimal, querysets) fall back
+# to the encoder DRF would have used
+_fallback_encoder = JSONEncoder()
+
+# Serializer DateTimeFields render UTC as 'Z'; match that for raw values() rows
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def encode_json(data, option=0):
+    """
+    Encode data to JSON bytes with orjson.
+    
+    Args:
+        data: Data to encode
+        option: Extra orjson option flags
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    return orjson.dumps(data, default=_fallback_encoder.default, option=ORJSON_OPTIONS | option)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson instead of the stdlib json module.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        
+        # orjson supports a single indent width; any requested indent uses it
+        renderer_context = renderer_context or {}
+        option = orjson.OPT_INDENT_2 if self.get_indent(accepted_media_type, renderer_context) else 0
+        return encode_json(data, option)
@@ -1,10 +1,15 @@
 """
 Version 1 serializers for the tracker application.
 Contains all serializers for the API v1 endpoints.
+
+The create() log lines dereference foreign keys, which can query when a
+relation is not already loaded, so they are guarded by
+logger.isEnabledFor(logging.INFO) and skipped when INFO is disabled.
 """
 
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.core.exceptions import FieldDoesNotExist
 from ...models import Project, Bug, Comment, ActivityLog
 import logging
 
@@ -12,7 +17,110 @@ import logging
 logger = logging.getLogger('tracker.api')
 
 
-class UserSerializer(serializers.ModelSerializer):
+class SerializerCacheMixin:
+    """
+    Reuse representations within one top-level serialization.
+    
+    Nested users and projects repeat across rows (the same assignee on many
+    bugs), so the first representation of each (serializer class, instance)
+    pair is stored on the root serializer and returned for later rows.
+    """
+    def to_representation(self, instance):
+        instance_pk = getattr(instance, 'pk', None)
+        if instance_pk is None:
+            return super().to_representation(instance)
+        
+        # The root serializer lives for one response, which bounds the cache
+        representation_cache = self.root.__dict__.setdefault('_representation_cache', {})
+        cache_key = (self.__class__, instance.__class__, instance_pk)
+        if cache_key not in representation_cache:
+            representation_cache[cache_key] = super().to_representation(instance)
+        return representation_cache[cache_key]
+
+
+class ForeignKeyPreloadListSerializer(serializers.ListSerializer):
+    """
+    List serializer that loads every referenced foreign key in one query per model.
+    
+    The ids named in the child's foreign_key_id_fields are collected from the
+    raw payload and fetched with in_bulk before the items are validated, so
+    the children resolve their references from context instead of querying.
+    """
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            requested_ids = {}
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+                for id_field, (related_model, _relation_name) in self.child.foreign_key_id_fields.items():
+                    try:
+                        requested_ids.setdefault(related_model, set()).add(int(item[id_field]))
+                    except (KeyError, TypeError, ValueError):
+                        # Missing or malformed ids are reported by field validation
+                        continue
+            
+            self.context['preloaded_related_objects'] = {
+                related_model: self.child.load_related_objects(related_model, object_ids)
+                for related_model, object_ids in requested_ids.items()
+            }
+        return super().to_internal_value(data)
+
+
+class ForeignKeyPreloadMixin:
+    """
+    Resolve write-only *_id fields to related instances during validation.
+    
+    Unknown ids fail with a field error instead of an IntegrityError at INSERT
+    time, and create()/update() receive the loaded instances, so later access
+    to the relation does not query again. Instances preloaded by
+    ForeignKeyPreloadListSerializer are reused; otherwise the ids of a single
+    payload are fetched with one in_bulk query per model.
+    """
+    # Maps write-only id fields to (related model, relation field name)
+    foreign_key_id_fields = {}
+    # Relations to join when loading a related model, e.g. {Bug: ('related_project',)}
+    foreign_key_select_related = {}
+    
+    def load_related_objects(self, related_model, object_ids):
+        """Fetch the referenced objects of one model, keyed by primary key"""
+        queryset = related_model.objects.all()
+        select_related_paths = self.foreign_key_select_related.get(related_model)
+        if select_related_paths:
+            queryset = queryset.select_related(*select_related_paths)
+        return queryset.in_bulk(list(object_ids))
+    
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        
+        preloaded_objects = self.context.get('preloaded_related_objects', {})
+        requested_ids = {}
+        for id_field, (related_model, _relation_name) in self.foreign_key_id_fields.items():
+            if attrs.get(id_field) is not None and related_model not in preloaded_objects:
+                requested_ids.setdefault(related_model, set()).add(attrs[id_field])
+        
+        loaded_objects = dict(preloaded_objects)
+        for related_model, object_ids in requested_ids.items():
+            loaded_objects[related_model] = self.load_related_objects(related_model, object_ids)
+        
+        for id_field, (related_model, relation_name) in self.foreign_key_id_fields.items():
+            if id_field not in attrs:
+                continue
+            object_id = attrs.pop(id_field)
+            if object_id is None:
+                attrs[relation_name] = None
+                continue
+            
+            related_object = loaded_objects.get(related_model, {}).get(object_id)
+            if related_object is None:
+                raise serializers.ValidationError({
+                    id_field: f'Invalid pk "{object_id}" - object does not exist.'
+                })
+            attrs[relation_name] = related_object
+        
+        return attrs
+
+
+class UserSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     """
     Serializer for User model to include user information in responses.
     """
@@ -22,14 +130,34 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSummarySerializer(SerializerCacheMixin, serializers.ModelSerializer):
+    """
+    Lightweight Project serializer for embedding inside other resources.
+    """
+    class Meta:
+        model = Project
+        fields = ['id', 'project_name']
+        read_only_fields = fields
+
+
+class ProjectListSerializer(serializers.ModelSerializer):
+    """
+    Slim Project serializer for list endpoints, without owner or bug counts.
+    """
+    class Meta:
+        model = Project
+        fields = ['id', 'project_name', 'project_owner_id', 'created_at', 'updated_at']
+        read_only_fields = fields
+
+
+class ProjectSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     """
     Serializer for Project model with detailed information.
     """
     project_owner = UserSerializer(read_only=True)
     project_owner_id = serializers.IntegerField(write_only=True, required=False)
-    total_bugs_count = serializers.SerializerMethodField()
-    open_bugs_count = serializers.SerializerMethodField()
+    total_bugs_count = serializers.IntegerField(read_only=True)
+    open_bugs_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Project
@@ -40,14 +168,6 @@ class ProjectSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-    def get_total_bugs_count(self, project_instance):
-        """Get total number of bugs in this project"""
-        return project_instance.total_bugs_count
-
-    def get_open_bugs_count(self, project_instance):
-        """Get number of open bugs in this project"""
-        return project_instance.open_bugs_count
-
     def create(self, validated_data):
         """Create a new project with proper logging"""
         project_owner_id = validated_data.pop('project_owner_id', None)
@@ -58,21 +178,28 @@ class ProjectSerializer(serializers.ModelSerializer):
             validated_data['project_owner'] = self.context['request'].user
         
         new_project = Project.objects.create(**validated_data)
-        logger.info(f"Project created via API: {new_project.project_name} by {new_project.project_owner.username}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Project created via API: %s by %s", new_project.project_name, new_project.project_owner.username)
         return new_project
 
 
-class BugSerializer(serializers.ModelSerializer):
+class BugSerializer(ForeignKeyPreloadMixin, SerializerCacheMixin, serializers.ModelSerializer):
     """
     Serializer for Bug model with comprehensive information.
     """
     assigned_to_user = UserSerializer(read_only=True)
     assigned_to_user_id = serializers.IntegerField(write_only=True, required=False, allow_null=True)
-    related_project = ProjectSerializer(read_only=True)
+    related_project = ProjectSummarySerializer(read_only=True)
     related_project_id = serializers.IntegerField(write_only=True)
     created_by_user = UserSerializer(read_only=True)
     created_by_user_id = serializers.IntegerField(write_only=True, required=False)
-    comments_count = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(read_only=True)
+    
+    foreign_key_id_fields = {
+        'assigned_to_user_id': (User, 'assigned_to_user'),
+        'related_project_id': (Project, 'related_project'),
+        'created_by_user_id': (User, 'created_by_user'),
+    }
     
     class Meta:
         model = Bug
@@ -83,22 +210,17 @@ class BugSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
-
-    def get_comments_count(self, bug_instance):
-        """Get total number of comments on this bug"""
-        return bug_instance.comments_count
+        list_serializer_class = ForeignKeyPreloadListSerializer
 
     def create(self, validated_data):
         """Create a new bug with proper logging"""
-        created_by_user_id = validated_data.pop('created_by_user_id', None)
-        if created_by_user_id:
-            validated_data['created_by_user_id'] = created_by_user_id
-        else:
+        if validated_data.get('created_by_user') is None:
             # Set the current user as creator if not specified
             validated_data['created_by_user'] = self.context['request'].user
         
         new_bug = Bug.objects.create(**validated_data)
-        logger.info(f"Bug created via API: {new_bug.bug_title} by {new_bug.created_by_user.username}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Bug created via API: %s by %s", new_bug.bug_title, new_bug.created_by_user.username)
         return new_bug
 
     def update(self, bug_instance, validated_data):
@@ -107,22 +229,139 @@ class BugSerializer(serializers.ModelSerializer):
         updated_bug = super().update(bug_instance, validated_data)
         
         if old_status != updated_bug.bug_status:
-            logger.info(f"Bug status updated via API: {updated_bug.bug_title} from {old_status} to {updated_bug.bug_status}")
+            logger.info("Bug status updated via API: %s from %s to %s", updated_bug.bug_title, old_status, updated_bug.bug_status)
         else:
-            logger.info(f"Bug updated via API: {updated_bug.bug_title}")
+            logger.info("Bug updated via API: %s", updated_bug.bug_title)
         
         return updated_bug
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class BugListSerializer(serializers.ModelSerializer):
+    """
+    Slim Bug serializer for list endpoints, exposing related objects by id.
+    """
+    class Meta:
+        model = Bug
+        fields = [
+            'id', 'bug_title', 'bug_status', 'bug_priority',
+            'assigned_to_user_id', 'related_project_id', 'created_by_user_id',
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
+
+
+def bug_list_values(bug_queryset):
+    """
+    Fetch the columns rendered by BugListSerializer as plain dicts.
+    
+    The rows already have the BugListSerializer shape, so read-only list
+    endpoints return them as-is and skip model instantiation and per-field
+    to_representation calls.
+    
+    Args:
+        bug_queryset: Filtered and ordered Bug QuerySet
+        
+    Returns:
+        QuerySet: Rows as dicts keyed by BugListSerializer fields
+    """
+    return bug_queryset.values(*BugListSerializer.Meta.fields)
+
+
+def _collect_related_paths(serializer, model, prefix, select_paths, prefetch_paths, in_prefetch):
+    """Walk readable nested serializers and record the relation path of each"""
+    for field in serializer.fields.values():
+        if field.write_only or field.source == '*':
+            continue
+        
+        many = isinstance(field, serializers.ListSerializer)
+        nested_serializer = field.child if many else field
+        if not isinstance(nested_serializer, serializers.ModelSerializer):
+            continue
+        
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            # Properties and other non-field sources cannot be joined
+            continue
+        if not model_field.is_relation:
+            continue
+        
+        relation_path = f'{prefix}{model_field.name}'
+        to_many = model_field.many_to_many or model_field.one_to_many
+        if in_prefetch or to_many:
+            prefetch_paths.append(relation_path)
+        else:
+            select_paths.append(relation_path)
+        
+        _collect_related_paths(
+            nested_serializer, model_field.related_model, f'{relation_path}__',
+            select_paths, prefetch_paths, in_prefetch or to_many
+        )
+
+
+def optimize_queryset_for(serializer_class, queryset):
+    """
+    Join or prefetch every relation the serializer renders.
+    
+    Nested ModelSerializer fields over foreign keys and one-to-one relations
+    become select_related paths; to-many relations, and anything nested
+    beneath them, become prefetch_related paths. Deriving the paths from the
+    serializer keeps the queryset in step with what is actually rendered.
+    
+    Args:
+        serializer_class: ModelSerializer class used for the response
+        queryset: QuerySet of serializer_class.Meta.model
+        
+    Returns:
+        QuerySet: The queryset with the required select/prefetch applied
+    """
+    select_paths, prefetch_paths = [], []
+    _collect_related_paths(
+        serializer_class(), queryset.model, '', select_paths, prefetch_paths, False
+    )
+    
+    if select_paths:
+        queryset = queryset.select_related(*select_paths)
+    if prefetch_paths:
+        queryset = queryset.prefetch_related(*prefetch_paths)
+    return queryset
+
+
+class BugDetailSerializer(BugSerializer):
+    """
+    Bug serializer for single-object responses, embedding the full project.
+    """
+    related_project = ProjectSerializer(read_only=True)
+
+
+class BugSummarySerializer(SerializerCacheMixin, serializers.ModelSerializer):
+    """
+    Lightweight Bug serializer for embedding inside other resources.
+    """
+    class Meta:
+        model = Bug
+        fields = ['id', 'bug_title', 'bug_status']
+        read_only_fields = fields
+
+
+class CommentSerializer(ForeignKeyPreloadMixin, serializers.ModelSerializer):
     """
     Serializer for Comment model with user and bug information.
     """
     commenter_user = UserSerializer(read_only=True)
     commenter_user_id = serializers.IntegerField(write_only=True, required=False)
-    related_bug = BugSerializer(read_only=True)
+    related_bug = BugSummarySerializer(read_only=True)
     related_bug_id = serializers.IntegerField(write_only=True)
     
+    foreign_key_id_fields = {
+        'commenter_user_id': (User, 'commenter_user'),
+        'related_bug_id': (Bug, 'related_bug'),
+    }
+    # Comment activity and notifications read the bug's project
+    foreign_key_select_related = {
+        Bug: ('related_project',),
+    }
+    
     class Meta:
         model = Comment
         fields = [
@@ -130,28 +369,34 @@ class CommentSerializer(serializers.ModelSerializer):
             'related_bug', 'related_bug_id', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+        list_serializer_class = ForeignKeyPreloadListSerializer
 
     def create(self, validated_data):
         """Create a new comment with proper logging"""
-        commenter_user_id = validated_data.pop('commenter_user_id', None)
-        if commenter_user_id:
-            validated_data['commenter_user_id'] = commenter_user_id
-        else:
+        if validated_data.get('commenter_user') is None:
             # Set the current user as commenter if not specified
             validated_data['commenter_user'] = self.context['request'].user
         
         new_comment = Comment.objects.create(**validated_data)
-        logger.info(f"Comment created via API by {new_comment.commenter_user.username} on bug {new_comment.related_bug.bug_title}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Comment created via API by %s on bug %s", new_comment.commenter_user.username, new_comment.related_bug.bug_title)
         return new_comment
 
 
+class CommentDetailSerializer(CommentSerializer):
+    """
+    Comment serializer for single-object responses, embedding the full bug.
+    """
+    related_bug = BugSerializer(read_only=True)
+
+
 class ActivityLogSerializer(serializers.ModelSerializer):
     """
     Serializer for ActivityLog model for streaming activities.
     """
     activity_user = UserSerializer(read_only=True)
-    related_project = ProjectSerializer(read_only=True)
-    related_bug = BugSerializer(read_only=True)
+    related_project = ProjectSummarySerializer(read_only=True)
+    related_bug = BugSummarySerializer(read_only=True)
     
     class Meta:
         model = ActivityLog
@@ -162,6 +407,27 @@ class ActivityLogSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
+class ActivityLogListSerializer(serializers.ModelSerializer):
+    """
+    Slim ActivityLog serializer for list endpoints, exposing related objects by id.
+    """
+    class Meta:
+        model = ActivityLog
+        fields = [
+            'id', 'activity_type', 'activity_description', 'activity_user_id',
+            'related_project_id', 'related_bug_id', 'created_at'
+        ]
+        read_only_fields = fields
+
+
+class ActivityLogDetailSerializer(ActivityLogSerializer):
+    """
+    ActivityLog serializer for single-object responses, embedding full objects.
+    """
+    related_project = ProjectSerializer(read_only=True)
+    related_bug = BugSerializer(read_only=True)
+
+
 class BugFilterSerializer(serializers.Serializer):
     """
     Serializer for filtering bugs by various criteria.
@@ -9,12 +9,18 @@ from rest_framework.response import Response
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from django.contrib.auth.models import User
-from django.db.models import Q
-from django.shortcuts import render, get_object_or_404
+from django.core.handlers.asgi import ASGIRequest
+from django.db import DatabaseError, transaction
+from django.http import StreamingHttpResponse
+from django.shortcuts import render
 from ...models import Project, Bug, Comment, ActivityLog
+from .filters import BugFilterSet, CommentFilterSet, ActivityLogFilterSet
+from .renderers import encode_json
 from .serializers import (
-    ProjectSerializer, BugSerializer, CommentSerializer, 
-    ActivityLogSerializer, UserSerializer, BugFilterSerializer
+    ProjectSerializer, ProjectListSerializer, BugSerializer, BugListSerializer,
+    BugDetailSerializer, CommentSerializer, CommentDetailSerializer,
+    ActivityLogSerializer, ActivityLogListSerializer, ActivityLogDetailSerializer,
+    UserSerializer, BugFilterSerializer, bug_list_values, optimize_queryset_for
 )
 from ...websocket_utils import send_websocket_notification
 from ...services import get_user_accessible_projects, get_bug_notification_recipients, create_activity_log
@@ -24,6 +30,39 @@ import logging
 logger = logging.getLogger('tracker.api')
 
 
+def emit_activity_on_commit(activity_type, description, project, user, bug=None,
+                            notification_data=None):
+    """
+    Record an activity and notify the project room once the current
+    transaction commits, keeping both side effects off the write path.
+    
+    Args:
+        activity_type: Type of activity, also used as the notification type
+        description: Description of the activity
+        project: Related project
+        user: User who performed the activity
+        bug: Related bug (optional)
+        notification_data: Payload for the project room (optional)
+    """
+    def _emit():
+        create_activity_log(
+            activity_type=activity_type,
+            description=description,
+            project=project,
+            user=user,
+            bug=bug
+        )
+        
+        if notification_data is not None:
+            send_websocket_notification(
+                project_id=project.id,
+                notification_type=activity_type,
+                notification_data=notification_data
+            )
+    
+    transaction.on_commit(_emit)
+
+
 def landing_page(request):
     """
     Simple landing page with links to API documentation.
@@ -31,7 +70,29 @@ def landing_page(request):
     return render(request, 'tracker/landing.html')
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class BugRowsResponseMixin:
+    """
+    Paginated responses for bug lists built from bug_list_values() rows.
+    """
+
+    def bug_rows_response(self, bug_rows):
+        """
+        Paginate bug rows, which already have the BugListSerializer shape.
+        
+        Args:
+            bug_rows: QuerySet returned by bug_list_values()
+            
+        Returns:
+            Response: Paginated response, or the full list if pagination is off
+        """
+        page = self.paginate_queryset(bug_rows)
+        if page is not None:
+            return self.get_paginated_response(page)
+        
+        return Response(list(bug_rows))
+
+
+class ProjectViewSet(BugRowsResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing projects with full CRUD operations.
     """
@@ -53,16 +114,28 @@ class ProjectViewSet(viewsets.ModelViewSet):
         # Get projects user has access to
         accessible_projects = get_user_accessible_projects(current_user)
         
-        logger.info(f"User {current_user.username} requested projects list")
+        accessible_projects = optimize_queryset_for(self.get_serializer_class(), accessible_projects)
+        
+        # Only the full serializer renders bug counts, computed in one GROUP BY
+        if self.action != 'list':
+            accessible_projects = accessible_projects.with_counts()
+        
+        logger.info("User %s requested projects list", current_user.username)
         return accessible_projects
 
+    def get_serializer_class(self):
+        """Use the slim serializer when listing projects"""
+        if self.action == 'list':
+            return ProjectListSerializer
+        return super().get_serializer_class()
+
     def perform_create(self, serializer):
         """Set the current user as project owner when creating"""
         new_project = serializer.save(project_owner=self.request.user)
-        logger.info(f"Project created: {new_project.project_name} by {self.request.user.username}")
+        logger.info("Project created: %s by %s", new_project.project_name, self.request.user.username)
         
-        # Create activity log
-        create_activity_log(
+        # Log the activity after commit
+        emit_activity_on_commit(
             activity_type='project_created',
             description=f"Project '{new_project.project_name}' was created",
             project=new_project,
@@ -72,10 +145,10 @@ class ProjectViewSet(viewsets.ModelViewSet):
     def perform_update(self, serializer):
         """Log project updates"""
         updated_project = serializer.save()
-        logger.info(f"Project updated: {updated_project.project_name} by {self.request.user.username}")
+        logger.info("Project updated: %s by %s", updated_project.project_name, self.request.user.username)
         
-        # Create activity log
-        create_activity_log(
+        # Log the activity after commit
+        emit_activity_on_commit(
             activity_type='project_updated',
             description=f"Project '{updated_project.project_name}' was updated",
             project=updated_project,
@@ -89,16 +162,13 @@ class ProjectViewSet(viewsets.ModelViewSet):
         """
         try:
             project_instance = self.get_object()
-            project_bugs = project_instance.project_bugs.select_related(
-                'assigned_to_user', 'created_by_user'
-            ).prefetch_related('bug_comments')
+            project_bugs = bug_list_values(project_instance.project_bugs.all())
             
-            serializer = BugSerializer(project_bugs, many=True, context={'request': request})
-            logger.info(f"Retrieved {len(project_bugs)} bugs for project {project_instance.project_name}")
-            return Response(serializer.data)
+            logger.info("Retrieving bugs for project %s", project_instance.project_name)
+            return self.bug_rows_response(project_bugs)
             
-        except Exception as e:
-            logger.error(f"Error retrieving bugs for project {pk}: {str(e)}")
+        except DatabaseError as e:
+            logger.error("Error retrieving bugs for project %s: %s", pk, e)
             return Response(
                 {'error': 'Failed to retrieve project bugs'}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -109,7 +179,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
     # TODO: Implement project archiving feature
 
 
-class BugViewSet(viewsets.ModelViewSet):
+class BugViewSet(BugRowsResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing bugs with full CRUD operations and filtering.
     """
@@ -117,57 +187,53 @@ class BugViewSet(viewsets.ModelViewSet):
     serializer_class = BugSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['bug_status', 'bug_priority', 'related_project', 'assigned_to_user']
+    filterset_class = BugFilterSet
     search_fields = ['bug_title', 'bug_description']
     ordering_fields = ['created_at', 'updated_at', 'bug_priority']
     ordering = ['-created_at']
+    list_actions = ('list', 'assigned_to_me', 'created_by_me')
 
     def get_queryset(self):
         """
-        Filter bugs based on query parameters and user permissions.
+        Build the bugs queryset. Query parameters are applied by BugFilterSet.
         """
-        queryset = Bug.objects.select_related(
-            'assigned_to_user', 'created_by_user', 'related_project'
-        ).prefetch_related('bug_comments')
+        queryset = optimize_queryset_for(self.get_serializer_class(), Bug.objects.all())
         current_user = self.request.user
         
-        # Apply filters based on query parameters
-        status_filter = self.request.query_params.get('status', None)
-        if status_filter:
-            queryset = queryset.filter(bug_status=status_filter)
-            logger.info(f"Filtering bugs by status: {status_filter}")
+        # List actions read plain columns; only full serializers render counts
+        if self.action not in self.list_actions:
+            queryset = queryset.with_counts()
         
-        project_filter = self.request.query_params.get('project', None)
-        if project_filter:
-            queryset = queryset.filter(related_project_id=project_filter)
-            logger.info(f"Filtering bugs by project ID: {project_filter}")
-        
-        assigned_user_filter = self.request.query_params.get('assigned_to', None)
-        if assigned_user_filter:
-            queryset = queryset.filter(assigned_to_user_id=assigned_user_filter)
-            logger.info(f"Filtering bugs by assigned user ID: {assigned_user_filter}")
-        
-        logger.info(f"User {current_user.username} requested bugs list with {queryset.count()} results")
+        logger.debug("User %s requested bugs list", current_user.username)
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        """
+        List bugs from values() rows instead of serializing model instances.
+        """
+        queryset = bug_list_values(self.filter_queryset(self.get_queryset()))
+        return self.bug_rows_response(queryset)
+
+    def get_serializer_class(self):
+        """Use the slim serializer on lists and embed the full project on retrieve"""
+        if self.action in self.list_actions:
+            return BugListSerializer
+        if self.action == 'retrieve':
+            return BugDetailSerializer
+        return super().get_serializer_class()
+
     def perform_create(self, serializer):
         """Create bug with proper logging and WebSocket notification"""
         new_bug = serializer.save(created_by_user=self.request.user)
-        logger.info(f"Bug created: {new_bug.bug_title} by {self.request.user.username}")
+        logger.info("Bug created: %s by %s", new_bug.bug_title, self.request.user.username)
         
-        # Create activity log
-        create_activity_log(
+        # Log the activity and notify the project team after commit
+        emit_activity_on_commit(
             activity_type='bug_created',
             description=f"Bug '{new_bug.bug_title}' was created",
             project=new_bug.related_project,
             user=self.request.user,
-            bug=new_bug
-        )
-        
-        # Send WebSocket notification to project team
-        send_websocket_notification(
-            project_id=new_bug.related_project.id,
-            notification_type='bug_created',
+            bug=new_bug,
             notification_data={
                 'bug_id': new_bug.id,
                 'bug_title': new_bug.bug_title,
@@ -178,30 +244,23 @@ class BugViewSet(viewsets.ModelViewSet):
 
     def perform_update(self, serializer):
         """Update bug with proper logging and WebSocket notification"""
-        # Get old bug data for comparison
-        existing_bug = get_object_or_404(Bug, pk=serializer.instance.pk)
-        old_status = existing_bug.bug_status
+        # serializer.instance is the bug loaded by get_object(), still unmodified
+        old_status = serializer.instance.bug_status
         
         updated_bug = serializer.save()
-        logger.info(f"Bug updated: {updated_bug.bug_title} by {self.request.user.username}")
+        logger.info("Bug updated: %s by %s", updated_bug.bug_title, self.request.user.username)
         
         # Check if status changed and handle accordingly
         if old_status != updated_bug.bug_status:
-            logger.info(f"Bug status changed: {updated_bug.bug_title} from {old_status} to {updated_bug.bug_status}")
+            logger.info("Bug status changed: %s from %s to %s", updated_bug.bug_title, old_status, updated_bug.bug_status)
             
-            # Create activity log for status change
-            create_activity_log(
+            # Log the status change and notify the project team after commit
+            emit_activity_on_commit(
                 activity_type='bug_status_changed',
                 description=f"Bug '{updated_bug.bug_title}' status changed from {old_status} to {updated_bug.bug_status}",
                 project=updated_bug.related_project,
                 user=self.request.user,
-                bug=updated_bug
-            )
-            
-            # Send WebSocket notification for status change
-            send_websocket_notification(
-                project_id=updated_bug.related_project.id,
-                notification_type='bug_status_changed',
+                bug=updated_bug,
                 notification_data={
                     'bug_id': updated_bug.id,
                     'bug_title': updated_bug.bug_title,
@@ -212,19 +271,13 @@ class BugViewSet(viewsets.ModelViewSet):
                 }
             )
         else:
-            # Create activity log for general update
-            create_activity_log(
+            # Log the general update and notify the project team after commit
+            emit_activity_on_commit(
                 activity_type='bug_updated',
                 description=f"Bug '{updated_bug.bug_title}' was updated",
                 project=updated_bug.related_project,
                 user=self.request.user,
-                bug=updated_bug
-            )
-            
-            # Send WebSocket notification for general update
-            send_websocket_notification(
-                project_id=updated_bug.related_project.id,
-                notification_type='bug_updated',
+                bug=updated_bug,
                 notification_data={
                     'bug_id': updated_bug.id,
                     'bug_title': updated_bug.bug_title,
@@ -240,16 +293,13 @@ class BugViewSet(viewsets.ModelViewSet):
         """
         try:
             current_user = request.user
-            assigned_bugs = Bug.objects.filter(assigned_to_user=current_user).select_related(
-                'assigned_to_user', 'created_by_user', 'related_project'
-            )
+            assigned_bugs = bug_list_values(Bug.objects.filter(assigned_to_user=current_user))
             
-            serializer = BugSerializer(assigned_bugs, many=True, context={'request': request})
-            logger.info(f"Retrieved {len(assigned_bugs)} bugs assigned to user {current_user.username}")
-            return Response(serializer.data)
+            logger.info("Retrieving bugs assigned to user %s", current_user.username)
+            return self.bug_rows_response(assigned_bugs)
             
-        except Exception as e:
-            logger.error(f"Error retrieving bugs assigned to user {request.user.username}: {str(e)}")
+        except DatabaseError as e:
+            logger.error("Error retrieving bugs assigned to user %s: %s", request.user.username, e)
             return Response(
                 {'error': 'Failed to retrieve assigned bugs'}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -262,16 +312,13 @@ class BugViewSet(viewsets.ModelViewSet):
         """
         try:
             current_user = request.user
-            created_bugs = Bug.objects.filter(created_by_user=current_user).select_related(
-                'assigned_to_user', 'created_by_user', 'related_project'
-            )
+            created_bugs = bug_list_values(Bug.objects.filter(created_by_user=current_user))
             
-            serializer = BugSerializer(created_bugs, many=True, context={'request': request})
-            logger.info(f"Retrieved {len(created_bugs)} bugs created by user {current_user.username}")
-            return Response(serializer.data)
+            logger.info("Retrieving bugs created by user %s", current_user.username)
+            return self.bug_rows_response(created_bugs)
             
-        except Exception as e:
-            logger.error(f"Error retrieving bugs created by user {request.user.username}: {str(e)}")
+        except DatabaseError as e:
+            logger.error("Error retrieving bugs created by user %s: %s", request.user.username, e)
             return Response(
                 {'error': 'Failed to retrieve created bugs'}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -290,49 +337,41 @@ class CommentViewSet(viewsets.ModelViewSet):
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, OrderingFilter]
-    filterset_fields = ['related_bug']
+    filterset_class = CommentFilterSet
     ordering_fields = ['created_at']
     ordering = ['created_at']
 
     def get_queryset(self):
         """
-        Filter comments based on query parameters.
+        Build the comments queryset. Query parameters are applied by CommentFilterSet.
         """
-        queryset = Comment.objects.select_related(
-            'commenter_user', 'related_bug', 'related_bug__related_project'
-        )
+        queryset = optimize_queryset_for(self.get_serializer_class(), Comment.objects.all())
         current_user = self.request.user
         
-        # Filter by bug if provided
-        bug_filter = self.request.query_params.get('bug', None)
-        if bug_filter:
-            queryset = queryset.filter(related_bug_id=bug_filter)
-            logger.info(f"Filtering comments by bug ID: {bug_filter}")
-        
-        logger.info(f"User {current_user.username} requested comments list with {queryset.count()} results")
+        logger.debug("User %s requested comments list", current_user.username)
         return queryset
 
+    def get_serializer_class(self):
+        """Embed the full bug only when retrieving a single comment"""
+        if self.action == 'retrieve':
+            return CommentDetailSerializer
+        return super().get_serializer_class()
+
     def perform_create(self, serializer):
         """Create comment with proper logging and WebSocket notification"""
         new_comment = serializer.save(commenter_user=self.request.user)
-        logger.info(f"Comment created by {self.request.user.username} on bug {new_comment.related_bug.bug_title}")
+        logger.info("Comment created by %s on bug %s", self.request.user.username, new_comment.related_bug.bug_title)
         
-        # Create activity log
-        create_activity_log(
+        # Determine notification recipients
+        notification_recipients = get_bug_notification_recipients(new_comment.related_bug)
+        
+        # Log the activity and notify bug creator and assigned user after commit
+        emit_activity_on_commit(
             activity_type='comment_added',
             description=f"Comment added to bug '{new_comment.related_bug.bug_title}'",
             project=new_comment.related_bug.related_project,
             user=self.request.user,
-            bug=new_comment.related_bug
-        )
-        
-        # Determine notification recipients
-        notification_recipients = get_bug_notification_recipients(new_comment.related_bug)
-        
-        # Send WebSocket notification to bug creator and assigned user
-        send_websocket_notification(
-            project_id=new_comment.related_bug.related_project.id,
-            notification_type='comment_added',
+            bug=new_comment.related_bug,
             notification_data={
                 'comment_id': new_comment.id,
                 'bug_id': new_comment.related_bug.id,
@@ -357,34 +396,63 @@ class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = ActivityLogSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, OrderingFilter]
-    filterset_fields = ['activity_type', 'related_project', 'related_bug']
+    filterset_class = ActivityLogFilterSet
     ordering_fields = ['created_at']
     ordering = ['-created_at']
 
     def get_queryset(self):
         """
-        Filter activity logs based on user permissions and query parameters.
+        Filter activity logs based on user permissions.
+        Query parameters are applied by ActivityLogFilterSet.
         """
         current_user = self.request.user
         
-        # Get activities for projects user has access to
+        # Get activities for projects user has access to. Filtering on a
+        # project id subquery avoids joining bugs and a DISTINCT over the logs.
         accessible_activities = ActivityLog.objects.filter(
-            Q(related_project__project_owner=current_user) |
-            Q(related_project__project_bugs__assigned_to_user=current_user) |
-            Q(related_project__project_bugs__created_by_user=current_user)
-        ).distinct().select_related(
-            'activity_user', 'related_project', 'related_bug'
+            related_project__in=get_user_accessible_projects(current_user).values('pk')
         )
         
-        # Filter by project if provided
-        project_filter = self.request.query_params.get('project', None)
-        if project_filter:
-            accessible_activities = accessible_activities.filter(related_project_id=project_filter)
-            logger.info(f"Filtering activities by project ID: {project_filter}")
+        # The list serializer exposes related objects by id only, so this
+        # joins nothing on lists
+        accessible_activities = optimize_queryset_for(self.get_serializer_class(), accessible_activities)
         
-        logger.info(f"User {current_user.username} requested activity logs with {accessible_activities.count()} results")
+        logger.debug("User %s requested activity logs", current_user.username)
         return accessible_activities
 
+    def get_serializer_class(self):
+        """Use the slim serializer on lists and embed full objects on retrieve"""
+        if self.action == 'list':
+            return ActivityLogListSerializer
+        if self.action == 'retrieve':
+            return ActivityLogDetailSerializer
+        return super().get_serializer_class()
+
+    @action(detail=False, methods=['get'])
+    def stream(self, request):
+        """
+        Stream accessible activity logs as newline-delimited JSON.
+        
+        Rows are fetched and sent in chunks. Django buffers the whole body when
+        the iterator does not match the server, so ASGI requests get an async
+        generator over aiterator() and WSGI requests a sync one over iterator().
+        """
+        activity_rows = self.filter_queryset(self.get_queryset()).values(
+            *ActivityLogListSerializer.Meta.fields
+        )
+        
+        if isinstance(request._request, ASGIRequest):
+            async def generate_activity_lines():
+                async for activity_row in activity_rows.aiterator(chunk_size=500):
+                    yield encode_json(activity_row) + b'\n'
+        else:
+            def generate_activity_lines():
+                for activity_row in activity_rows.iterator(chunk_size=500):
+                    yield encode_json(activity_row) + b'\n'
+        
+        logger.info("User %s requested activity stream", request.user.username)
+        return StreamingHttpResponse(generate_activity_lines(), content_type='application/x-ndjson')
+
     # TODO: Add activity export functionality
     # TODO: Implement activity filtering by date range
     # TODO: Add activity summary endpoints 
\ No newline at end of file
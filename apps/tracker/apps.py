@@ -5,3 +5,11 @@ class TrackerConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.tracker'
     verbose_name = 'Bug Tracker'
+
+    def ready(self):
+        # Register signal handlers
+        from . import signals  # noqa: F401
+        
+        # Hand tracker log I/O to background listener threads
+        from .logging_queue import start_queued_logging
+        start_queued_logging()
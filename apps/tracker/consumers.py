@@ -1,23 +1,198 @@
-import json
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.contrib.auth.models import User
-from django.utils import timezone
-from django.shortcuts import get_object_or_404
-from .models import Project, ActivityLog
-from .websocket_utils import get_project_room_name, validate_websocket_message
+from django.core.cache import cache
+from .models import ActivityLog
+from .services import can_user_access_project, get_project_access_version
+from .websocket_utils import get_project_room_name, decode_websocket_message
+from datetime import datetime, timezone as dt_timezone
+import asyncio
 import logging
+import time
+import orjson
 
 # Set up logging for WebSocket consumers
 logger = logging.getLogger('tracker.websocket')
 
+# Seconds a project room access decision is reused across connections
+PROJECT_ROOM_ACCESS_CACHE_TIMEOUT = 60
 
-class TrackerConsumer(AsyncWebsocketConsumer):
+# Largest incoming text frame, in characters, that is decoded
+MAX_WEBSOCKET_MESSAGE_SIZE = 16 * 1024
+
+# Outgoing frames a connection may have waiting for the writer task; a client
+# that falls this far behind is disconnected (see QueuedSendMixin)
+MAX_PENDING_OUTGOING_FRAMES = 256
+
+
+def encode_message(message_data):
+    """
+    Encode an outgoing WebSocket message as a JSON text frame with orjson.
+    
+    Args:
+        message_data: Message dict to send
+        
+    Returns:
+        str: JSON text for self.send(text_data=...)
+    """
+    return orjson.dumps(message_data).decode()
+
+
+# Handlers answering within the same millisecond share one formatted timestamp
+TIMESTAMP_CACHE_TTL = 0.001
+_timestamp_cache = [float('-inf'), '']
+
+
+def current_timestamp():
+    """
+    Get the current time as an ISO 8601 string, reused for up to TIMESTAMP_CACHE_TTL.
+    
+    Returns:
+        str: Current timestamp in ISO 8601 format
+    """
+    # One wall clock read drives both the expiry check and the formatted value;
+    # a clock stepping backwards also refreshes the cache
+    wall_now = time.time()
+    if not 0 <= wall_now - _timestamp_cache[0] <= TIMESTAMP_CACHE_TTL:
+        _timestamp_cache[:] = [wall_now, datetime.fromtimestamp(wall_now, dt_timezone.utc).isoformat()]
+    return _timestamp_cache[1]
+
+
+# Static frames are encoded once; pong only splices in the timestamp, which
+# isoformat() guarantees needs no JSON escaping
+INVALID_JSON_FRAME = encode_message({'type': 'error', 'message': 'Invalid JSON format'})
+INTERNAL_ERROR_FRAME = encode_message({'type': 'error', 'message': 'Internal server error'})
+PONG_FRAME_TEMPLATE = '{"type":"pong","timestamp":"%s"}'
+
+
+class QueuedSendMixin:
+    """
+    Route outgoing frames through a per-connection queue drained by one writer task.
+    
+    Handlers and group events enqueue frames without awaiting the transport,
+    so a slow client does not hold up message handling. The writer sends each
+    frame as its own WebSocket message, in queue order, because clients parse
+    each one as a JSON document.
+    
+    close() stops accepting frames, waits for the writer to send everything
+    already queued and only then closes the socket, so no frame follows the
+    close. The queue is bounded by MAX_PENDING_OUTGOING_FRAMES. When it
+    overflows, the connection is closed with 1013 (try again later) so the
+    client reconnects instead of silently missing frames. If the writer task
+    fails, the connection is closed with 1011. In both cases pending frames
+    are dropped and later sends are ignored.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.outgoing_frames = asyncio.Queue(maxsize=MAX_PENDING_OUTGOING_FRAMES)
+        self.writer_task = None
+        self.outgoing_closed = False
+
+    async def accept(self, subprotocol=None, headers=None):
+        """Accept the socket and start the writer task"""
+        await super().accept(subprotocol=subprotocol, headers=headers)
+        self.writer_task = asyncio.create_task(self.write_outgoing_frames())
+
+    async def send(self, text_data=None, bytes_data=None, close=False):
+        """Queue a frame for the writer task, or send directly before accept()"""
+        if self.outgoing_closed:
+            return
+        
+        if self.writer_task is None:
+            await super().send(text_data=text_data, bytes_data=bytes_data, close=close)
+            return
+        
+        if text_data is None and bytes_data is None:
+            raise ValueError("You must pass one of bytes_data or text_data")
+        try:
+            self.outgoing_frames.put_nowait((text_data, bytes_data))
+        except asyncio.QueueFull:
+            logger.warning("Closing WebSocket: %s outgoing frames pending", self.outgoing_frames.qsize())
+            await self.abort_outgoing_frames(code=1013)
+            return
+        
+        if close:
+            await self.close(close)
+
+    async def close(self, code=None, reason=None):
+        """Write any queued frames, stop the writer task, then close the socket"""
+        if self.outgoing_closed:
+            return
+        self.outgoing_closed = True
+        
+        writer_task, self.writer_task = self.writer_task, None
+        if writer_task is not None:
+            # The writer marks frames done only once they are sent, so join()
+            # also covers a batch it is in the middle of writing
+            queue_drained = asyncio.ensure_future(self.outgoing_frames.join())
+            await asyncio.wait({queue_drained, writer_task}, return_when=asyncio.FIRST_COMPLETED)
+            queue_drained.cancel()
+            if writer_task.done():
+                # The writer failed and has already closed the socket with 1011
+                return
+            writer_task.cancel()
+        
+        await super().close(code=code, reason=reason)
+
+    async def websocket_disconnect(self, message):
+        """Stop the writer task once the client is gone"""
+        try:
+            await super().websocket_disconnect(message)
+        finally:
+            if self.writer_task is not None:
+                self.writer_task.cancel()
+                self.writer_task = None
+
+    async def write_outgoing_frames(self):
+        """Drain the queue, writing every frame pending at each wake-up"""
+        try:
+            while True:
+                pending_frames = [await self.outgoing_frames.get()]
+                while not self.outgoing_frames.empty():
+                    pending_frames.append(self.outgoing_frames.get_nowait())
+                
+                try:
+                    for text_data, bytes_data in pending_frames:
+                        await AsyncWebsocketConsumer.send(self, text_data=text_data, bytes_data=bytes_data)
+                finally:
+                    for _ in pending_frames:
+                        self.outgoing_frames.task_done()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Error writing WebSocket frames: %s", e)
+            await self.abort_outgoing_frames(code=1011)
+
+    async def abort_outgoing_frames(self, code):
+        """Stop the writer task, drop pending frames and close the socket"""
+        self.outgoing_closed = True
+        writer_task, self.writer_task = self.writer_task, None
+        if writer_task is not None and writer_task is not asyncio.current_task():
+            writer_task.cancel()
+        
+        while not self.outgoing_frames.empty():
+            self.outgoing_frames.get_nowait()
+            self.outgoing_frames.task_done()
+        
+        try:
+            await AsyncWebsocketConsumer.close(self, code=code)
+        except Exception as e:
+            logger.error("Error closing WebSocket: %s", e)
+
+
+class TrackerConsumer(QueuedSendMixin, AsyncWebsocketConsumer):
     """
     General WebSocket consumer for tracker-wide communication.
     Handles general notifications and system-wide messages.
     """
     
+    # Incoming message type -> handler method name
+    message_handlers = {
+        'ping': 'handle_ping',
+        'test_message': 'handle_test_message',
+    }
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.user = None
@@ -38,16 +213,16 @@ class TrackerConsumer(AsyncWebsocketConsumer):
             await self.accept()
             
             # Send connection confirmation
-            await self.send(text_data=json.dumps({
+            await self.send(text_data=encode_message({
                 'type': 'connection_established',
                 'message': 'Connected to tracker WebSocket',
                 'user': self.user.username
             }))
             
-            logger.info(f"User {self.user.username} connected to general tracker WebSocket")
+            logger.info("User %s connected to general tracker WebSocket", self.user.username)
             
         except Exception as e:
-            logger.error(f"Error in general WebSocket connect: {str(e)}")
+            logger.error("Error in general WebSocket connect: %s", e)
             await self.close()
 
     async def disconnect(self, close_code):
@@ -55,21 +230,30 @@ class TrackerConsumer(AsyncWebsocketConsumer):
         Handle WebSocket disconnection.
         """
         try:
-            logger.info(f"User {self.user.username if self.user else 'Unknown'} disconnected from general tracker WebSocket")
+            logger.info("User %s disconnected from general tracker WebSocket", self.user.username if self.user else 'Unknown')
         except Exception as e:
-            logger.error(f"Error in general WebSocket disconnect: {str(e)}")
+            logger.error("Error in general WebSocket disconnect: %s", e)
 
-    async def receive(self, text_data):
+    async def receive(self, text_data=None, bytes_data=None):
         """
         Handle incoming WebSocket messages.
         """
+        # Reject frames before decoding: binary frames are unsupported (1003)
+        # and oversized ones are too big to parse (1009)
+        if text_data is None:
+            logger.warning("Closing WebSocket for user %s: binary frame received", self.user.username)
+            await self.close(code=1003)
+            return
+        if len(text_data) > MAX_WEBSOCKET_MESSAGE_SIZE:
+            logger.warning("Closing WebSocket for user %s: %s character frame exceeds limit", self.user.username, len(text_data))
+            await self.close(code=1009)
+            return
+        
         try:
-            message_data = json.loads(text_data)
-            
-            # Validate message format
-            is_valid, error_message = validate_websocket_message(message_data)
-            if not is_valid:
-                await self.send(text_data=json.dumps({
+            # Parse and validate message format
+            message_data, error_message = decode_websocket_message(text_data)
+            if message_data is None:
+                await self.send(text_data=encode_message({
                     'type': 'error',
                     'message': error_message
                 }))
@@ -78,66 +262,62 @@ class TrackerConsumer(AsyncWebsocketConsumer):
             message_type = message_data['type']
             
             # Route message to appropriate handler
-            if message_type == 'ping':
-                await self.handle_ping()
-            elif message_type == 'test_message':
-                await self.handle_test_message(message_data)
+            handler_name = self.message_handlers.get(message_type)
+            if handler_name is not None:
+                await getattr(self, handler_name)(message_data)
             else:
-                logger.warning(f"Unhandled message type in general consumer: {message_type}")
+                logger.warning("Unhandled message type in general consumer: %s", message_type)
                 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error("Invalid JSON received in general WebSocket message")
-            await self.send(text_data=json.dumps({
-                'type': 'error',
-                'message': 'Invalid JSON format'
-            }))
+            await self.send(text_data=INVALID_JSON_FRAME)
         except Exception as e:
-            logger.error(f"Error handling general WebSocket message: {str(e)}")
-            await self.send(text_data=json.dumps({
-                'type': 'error',
-                'message': 'Internal server error'
-            }))
+            logger.error("Error handling general WebSocket message: %s", e)
+            await self.send(text_data=INTERNAL_ERROR_FRAME)
 
-    async def handle_ping(self):
+    async def handle_ping(self, message_data=None):
         """
         Handle ping message for connection health check.
         """
-        try:
-            await self.send(text_data=json.dumps({
-                'type': 'pong',
-                'timestamp': str(timezone.now())
-            }))
-            
-        except Exception as e:
-            logger.error(f"Error handling ping: {str(e)}")
+        await self.send(text_data=PONG_FRAME_TEMPLATE % current_timestamp())
 
     async def handle_test_message(self, message_data):
         """
         Handle test message for debugging.
         """
         try:
-            await self.send(text_data=json.dumps({
+            await self.send(text_data=encode_message({
                 'type': 'test_response',
                 'message': f"Received test message: {message_data.get('message', '')}",
                 'user': self.user.username,
-                'timestamp': str(timezone.now())
+                'timestamp': current_timestamp()
             }))
             
         except Exception as e:
-            logger.error(f"Error handling test message: {str(e)}")
+            logger.error("Error handling test message: %s", e)
 
 
-class ProjectRoomConsumer(AsyncWebsocketConsumer):
+class ProjectRoomConsumer(QueuedSendMixin, AsyncWebsocketConsumer):
     """
     WebSocket consumer for project-based real-time communication.
     Handles joining/leaving project rooms and broadcasting notifications.
     """
     
+    # Incoming message type -> handler method name
+    message_handlers = {
+        'typing_start': 'handle_typing_start',
+        'typing_stop': 'handle_typing_stop',
+        'ping': 'handle_ping',
+        'test_project_message': 'handle_test_project_message',
+    }
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.project_id = None
         self.project_room_group_name = None
         self.user = None
+        self.project_access_granted = None
+        self.joined_project_room = False
 
     async def connect(self):
         """
@@ -152,37 +332,40 @@ class ProjectRoomConsumer(AsyncWebsocketConsumer):
             self.user = self.scope.get('user')
             
             if not self.user or not self.user.is_authenticated:
-                logger.warning(f"Unauthenticated user attempted to connect to project {self.project_id}")
+                logger.warning("Unauthenticated user attempted to connect to project %s", self.project_id)
                 await self.close()
                 return
             
             # Verify user has access to this project
             has_project_access = await self.check_project_access()
             if not has_project_access:
-                logger.warning(f"User {self.user.username} denied access to project {self.project_id}")
+                logger.warning("User %s denied access to project %s", self.user.username, self.project_id)
                 await self.close()
                 return
             
+            # Complete the handshake before the channel layer round trip; the
+            # confirmation below is only sent once the room has been joined
+            await self.accept()
+            
             # Join project room group
             await self.channel_layer.group_add(
                 self.project_room_group_name,
                 self.channel_name
             )
-            
-            await self.accept()
+            self.joined_project_room = True
             
             # Send connection confirmation
-            await self.send(text_data=json.dumps({
+            await self.send(text_data=encode_message({
                 'type': 'connection_established',
                 'message': f'Connected to project {self.project_id}',
                 'project_id': self.project_id,
                 'user': self.user.username
             }))
             
-            logger.info(f"User {self.user.username} connected to project {self.project_id} WebSocket")
+            logger.info("User %s connected to project %s WebSocket", self.user.username, self.project_id)
             
         except Exception as e:
-            logger.error(f"Error in WebSocket connect: {str(e)}")
+            logger.error("Error in WebSocket connect: %s", e)
             await self.close()
 
     async def disconnect(self, close_code):
@@ -190,29 +373,39 @@ class ProjectRoomConsumer(AsyncWebsocketConsumer):
         Handle WebSocket disconnection.
         """
         try:
-            if self.project_room_group_name:
+            # Rejected connections never joined, so they skip the round trip
+            if self.joined_project_room:
                 # Leave project room group
                 await self.channel_layer.group_discard(
                     self.project_room_group_name,
                     self.channel_name
                 )
                 
-                logger.info(f"User {self.user.username if self.user else 'Unknown'} disconnected from project {self.project_id} WebSocket")
+                logger.info("User %s disconnected from project %s WebSocket", self.user.username if self.user else 'Unknown', self.project_id)
                 
         except Exception as e:
-            logger.error(f"Error in WebSocket disconnect: {str(e)}")
+            logger.error("Error in WebSocket disconnect: %s", e)
 
-    async def receive(self, text_data):
+    async def receive(self, text_data=None, bytes_data=None):
         """
         Handle incoming WebSocket messages.
         """
+        # Reject frames before decoding: binary frames are unsupported (1003)
+        # and oversized ones are too big to parse (1009)
+        if text_data is None:
+            logger.warning("Closing WebSocket for user %s: binary frame received", self.user.username)
+            await self.close(code=1003)
+            return
+        if len(text_data) > MAX_WEBSOCKET_MESSAGE_SIZE:
+            logger.warning("Closing WebSocket for user %s: %s character frame exceeds limit", self.user.username, len(text_data))
+            await self.close(code=1009)
+            return
+        
         try:
-            message_data = json.loads(text_data)
-            
-            # Validate message format
-            is_valid, error_message = validate_websocket_message(message_data)
-            if not is_valid:
-                await self.send(text_data=json.dumps({
+            # Parse and validate message format
+            message_data, error_message = decode_websocket_message(text_data)
+            if message_data is None:
+                await self.send(text_data=encode_message({
                     'type': 'error',
                     'message': error_message
                 }))
@@ -221,100 +414,91 @@ class ProjectRoomConsumer(AsyncWebsocketConsumer):
             message_type = message_data['type']
             
             # Route message to appropriate handler
-            if message_type == 'typing_start':
-                await self.handle_typing_start(message_data)
-            elif message_type == 'typing_stop':
-                await self.handle_typing_stop(message_data)
-            elif message_type == 'ping':
-                await self.handle_ping()
-            elif message_type == 'test_project_message':
-                await self.handle_test_project_message(message_data)
+            handler_name = self.message_handlers.get(message_type)
+            if handler_name is not None:
+                await getattr(self, handler_name)(message_data)
             else:
-                logger.warning(f"Unhandled message type: {message_type}")
+                logger.warning("Unhandled message type: %s", message_type)
                 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error("Invalid JSON received in WebSocket message")
-            await self.send(text_data=json.dumps({
-                'type': 'error',
-                'message': 'Invalid JSON format'
-            }))
+            await self.send(text_data=INVALID_JSON_FRAME)
         except Exception as e:
-            logger.error(f"Error handling WebSocket message: {str(e)}")
-            await self.send(text_data=json.dumps({
-                'type': 'error',
-                'message': 'Internal server error'
-            }))
+            logger.error("Error handling WebSocket message: %s", e)
+            await self.send(text_data=INTERNAL_ERROR_FRAME)
 
     async def handle_typing_start(self, message_data):
         """
         Handle typing start indicator.
         """
-        try:
-            # Broadcast typing indicator to project room
-            await self.channel_layer.group_send(
-                self.project_room_group_name,
-                {
-                    'type': 'send_typing_indicator',
+        # Broadcast typing indicator to project room
+        await self.channel_layer.group_send(
+            self.project_room_group_name,
+            {
+                'type': 'send_typing_indicator',
+                'user_id': self.user.id,
+                'username': self.user.username,
+                'is_typing': True,
+                'sender_channel': self.channel_name,
+                'frame': encode_message({
+                    'type': 'typing_indicator',
                     'user_id': self.user.id,
                     'username': self.user.username,
                     'is_typing': True
-                }
-            )
-            
-            logger.info(f"User {self.user.username} started typing in project {self.project_id}")
-            
-        except Exception as e:
-            logger.error(f"Error handling typing start: {str(e)}")
+                })
+            }
+        )
+        
+        # Typing events are the busiest path; skip formatting when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("User %s started typing in project %s", self.user.username, self.project_id)
 
     async def handle_typing_stop(self, message_data):
         """
         Handle typing stop indicator.
         """
-        try:
-            # Broadcast typing stop to project room
-            await self.channel_layer.group_send(
-                self.project_room_group_name,
-                {
-                    'type': 'send_typing_indicator',
+        # Broadcast typing stop to project room
+        await self.channel_layer.group_send(
+            self.project_room_group_name,
+            {
+                'type': 'send_typing_indicator',
+                'user_id': self.user.id,
+                'username': self.user.username,
+                'is_typing': False,
+                'sender_channel': self.channel_name,
+                'frame': encode_message({
+                    'type': 'typing_indicator',
                     'user_id': self.user.id,
                     'username': self.user.username,
                     'is_typing': False
-                }
-            )
-            
-            logger.info(f"User {self.user.username} stopped typing in project {self.project_id}")
-            
-        except Exception as e:
-            logger.error(f"Error handling typing stop: {str(e)}")
+                })
+            }
+        )
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("User %s stopped typing in project %s", self.user.username, self.project_id)
 
-    async def handle_ping(self):
+    async def handle_ping(self, message_data=None):
         """
         Handle ping message for connection health check.
         """
-        try:
-            await self.send(text_data=json.dumps({
-                'type': 'pong',
-                'timestamp': str(timezone.now())
-            }))
-            
-        except Exception as e:
-            logger.error(f"Error handling ping: {str(e)}")
+        await self.send(text_data=PONG_FRAME_TEMPLATE % current_timestamp())
 
     async def handle_test_project_message(self, message_data):
         """
         Handle test message for project room debugging.
         """
         try:
-            await self.send(text_data=json.dumps({
+            await self.send(text_data=encode_message({
                 'type': 'test_project_response',
                 'message': f"Received test message in project {self.project_id}: {message_data.get('message', '')}",
                 'project_id': self.project_id,
                 'user': self.user.username,
-                'timestamp': str(timezone.now())
+                'timestamp': current_timestamp()
             }))
             
         except Exception as e:
-            logger.error(f"Error handling test project message: {str(e)}")
+            logger.error("Error handling test project message: %s", e)
 
     # Group message handlers
     async def send_notification(self, event):
@@ -325,33 +509,38 @@ class ProjectRoomConsumer(AsyncWebsocketConsumer):
             notification_type = event['notification_type']
             notification_data = event['data']
             
-            await self.send(text_data=json.dumps({
+            await self.send(text_data=encode_message({
                 'type': 'notification',
                 'notification_type': notification_type,
                 'data': notification_data
             }))
             
-            logger.info(f"Notification sent to user {self.user.username}: {notification_type}")
+            logger.info("Notification sent to user %s: %s", self.user.username, notification_type)
             
         except Exception as e:
-            logger.error(f"Error sending notification: {str(e)}")
+            logger.error("Error sending notification: %s", e)
 
     async def send_typing_indicator(self, event):
         """
         Send typing indicator to WebSocket client.
         """
-        try:
-            # Don't send typing indicator back to the user who is typing
-            if event['user_id'] != self.user.id:
-                await self.send(text_data=json.dumps({
+        # The group echoes the event to the sending connection; drop it first
+        if event.get('sender_channel') == self.channel_name:
+            return
+        
+        # Don't send typing indicator back to the user who is typing
+        if event['user_id'] != self.user.id:
+            # Consumers encode the frame once at group_send time; events
+            # from websocket_utils arrive without one
+            typing_frame = event.get('frame')
+            if typing_frame is None:
+                typing_frame = encode_message({
                     'type': 'typing_indicator',
                     'user_id': event['user_id'],
                     'username': event['username'],
                     'is_typing': event['is_typing']
-                }))
-                
-        except Exception as e:
-            logger.error(f"Error sending typing indicator: {str(e)}")
+                })
+            await self.send(text_data=typing_frame)
 
     async def send_activity_update(self, event):
         """
@@ -360,48 +549,49 @@ class ProjectRoomConsumer(AsyncWebsocketConsumer):
         try:
             activity_data = event['activity_data']
             
-            await self.send(text_data=json.dumps({
+            await self.send(text_data=encode_message({
                 'type': 'activity_update',
                 'activity_data': activity_data
             }))
             
-            logger.info(f"Activity update sent to user {self.user.username}")
+            logger.info("Activity update sent to user %s", self.user.username)
             
         except Exception as e:
-            logger.error(f"Error sending activity update: {str(e)}")
+            logger.error("Error sending activity update: %s", e)
 
-    @database_sync_to_async
-    def check_project_access(self):
+    async def check_project_access(self):
         """
         Check if the current user has access to the project.
         Users have access if they own the project or are involved in its bugs.
+        The decision is kept for the lifetime of the connection.
+        """
+        if self.project_access_granted is None:
+            self.project_access_granted = await self.query_project_access()
+        return self.project_access_granted
+
+    @database_sync_to_async
+    def query_project_access(self):
+        """
+        Resolve project access in a single query covering ownership,
+        assigned bugs and created bugs.
+        
+        Decisions are cached per user and project under the current access
+        version, so reconnecting clients skip the query until a project or
+        bug change invalidates it (see invalidate_project_access_cache).
         """
         try:
-            project = get_object_or_404(Project, id=self.project_id)
-            
-            # Check if user is project owner
-            if project.project_owner == self.user:
-                return True
+            cache_key = f"ws_project_access:{self.user.pk}:{self.project_id}:{get_project_access_version()}"
+            access_granted = cache.get(cache_key)
+            if access_granted is None:
+                access_granted = can_user_access_project(self.user, self.project_id)
+                cache.set(cache_key, access_granted, PROJECT_ROOM_ACCESS_CACHE_TIMEOUT)
+            return access_granted
             
-            # Check if user is assigned to any bugs in the project
-            if project.project_bugs.filter(assigned_to_user=self.user).exists():
-                return True
-            
-            # Check if user created any bugs in the project
-            if project.project_bugs.filter(created_by_user=self.user).exists():
-                return True
-            
-            return False
-            
-        except Project.DoesNotExist:
-            logger.error(f"Project {self.project_id} does not exist")
-            return False
         except Exception as e:
-            logger.error(f"Error checking project access: {str(e)}")
+            logger.error("Error checking project access: %s", e)
             return False
 
     # TODO: Add WebSocket connection rate limiting per user
-    # TODO: Implement WebSocket message size validation
     # TODO: Add WebSocket connection timeout handling
     # TODO: Implement WebSocket reconnection logic
 
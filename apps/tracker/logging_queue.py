@@ -0,0 +1,87 @@
+"""
+Queued logging for the tracker loggers.
+
+Model saves, services and consumers log on the request path. Routing those
+loggers through a QueueHandler means the calling thread only enqueues the
+record, while a QueueListener thread owns the configured file and console
+handlers and does the formatting and disk I/O.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Loggers whose configured handlers are moved behind a queue
+QUEUED_LOGGER_NAMES = (
+    'tracker.api',
+    'tracker.models',
+    'tracker.services',
+    'tracker.websocket',
+)
+LOG_QUEUE_MAXSIZE = 10000
+
+_listeners = []
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread and drops
+    records when the queue is full instead of erroring.
+    """
+
+    def prepare(self, record):
+        # The stock prepare() formats the message on the calling thread so the
+        # record can be pickled. This queue never leaves the process, so the
+        # record is passed through and the listener's handlers format it.
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # The listener is behind; losing a log line beats blocking a request
+            pass
+
+
+def start_queued_logging():
+    """
+    Move the handlers of the tracker loggers onto background listener threads.
+
+    Loggers that share the same handlers (for example tracker.models and
+    tracker.services) share one queue and listener, so each handler is only
+    driven by a single thread. Safe to call more than once.
+    """
+    if _listeners:
+        return
+
+    queues_by_handlers = {}
+    for logger_name in QUEUED_LOGGER_NAMES:
+        tracker_logger = logging.getLogger(logger_name)
+        handlers = tuple(
+            handler for handler in tracker_logger.handlers
+            if not isinstance(handler, QueueHandler)
+        )
+        if not handlers:
+            continue
+
+        log_queue = queues_by_handlers.get(handlers)
+        if log_queue is None:
+            log_queue = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+            queues_by_handlers[handlers] = log_queue
+            _listeners.append(QueueListener(log_queue, *handlers, respect_handler_level=True))
+
+        for handler in handlers:
+            tracker_logger.removeHandler(handler)
+        tracker_logger.addHandler(NonBlockingQueueHandler(log_queue))
+
+    for listener in _listeners:
+        listener.start()
+    if _listeners:
+        atexit.register(stop_queued_logging)
+
+
+def stop_queued_logging():
+    """Flush pending records and stop the listener threads"""
+    while _listeners:
+        _listeners.pop().stop()
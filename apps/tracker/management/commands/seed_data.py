@@ -3,9 +3,11 @@ Management command to seed the database with test data.
 """
 
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.db import transaction
 from apps.tracker.models import Project, Bug, Comment, ActivityLog
-from apps.tracker.services import create_activity_log
+from apps.tracker.services import ActivityLogBuffer, create_activity_log, invalidate_project_access_cache
 import logging
 
 logger = logging.getLogger('tracker.seed')
@@ -14,219 +16,300 @@ logger = logging.getLogger('tracker.seed')
 class Command(BaseCommand):
     help = 'Seed the database with test data'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--quiet',
+            action='store_true',
+            help='Suppress progress output and the final summary'
+        )
+
+    def write_progress(self, *lines):
+        """Write progress lines in a single call unless running quietly"""
+        if lines and not self.quiet:
+            self.stdout.write('\n'.join(lines))
+
     def handle(self, *args, **options):
-        self.stdout.write('Starting to seed database...')
+        self.quiet = options['quiet'] or options['verbosity'] == 0
+        self.write_progress('Starting to seed database...')
         
         try:
-            # Create test users
-            self.stdout.write('Creating test users...')
-            
-            # Get or create admin user
-            admin_user, created = User.objects.get_or_create(
-                username='admin',
-                defaults={
-                    'email': 'admin@example.com',
-                    'first_name': 'Admin',
-                    'last_name': 'User',
-                    'is_staff': True,
-                    'is_superuser': True
-                }
-            )
-            if created:
-                admin_user.set_password('admin123')
-                admin_user.save()
-                self.stdout.write(self.style.SUCCESS('Created admin user'))
-            
-            # Create test users
-            test_users = [
-                {
-                    'username': 'developer1',
-                    'email': 'dev1@example.com',
-                    'first_name': 'John',
-                    'last_name': 'Developer'
-                },
-                {
-                    'username': 'developer2',
-                    'email': 'dev2@example.com',
-                    'first_name': 'Jane',
-                    'last_name': 'Coder'
-                },
-                {
-                    'username': 'tester1',
-                    'email': 'tester1@example.com',
-                    'first_name': 'Bob',
-                    'last_name': 'Tester'
-                }
-            ]
-            
-            created_users = []
-            for user_data in test_users:
-                user, created = User.objects.get_or_create(
-                    username=user_data['username'],
-                    defaults=user_data
+            # Seed everything in one transaction: a single commit, and a failed
+            # run leaves no partial data behind
+            with transaction.atomic():
+                # Create test users
+                self.write_progress('Creating test users...')
+                
+                # Admin first, then the regular test users
+                users_data = [
+                    {
+                        'username': 'admin',
+                        'email': 'admin@example.com',
+                        'first_name': 'Admin',
+                        'last_name': 'User',
+                        'is_staff': True,
+                        'is_superuser': True
+                    },
+                    {
+                        'username': 'developer1',
+                        'email': 'dev1@example.com',
+                        'first_name': 'John',
+                        'last_name': 'Developer'
+                    },
+                    {
+                        'username': 'developer2',
+                        'email': 'dev2@example.com',
+                        'first_name': 'Jane',
+                        'last_name': 'Coder'
+                    },
+                    {
+                        'username': 'tester1',
+                        'email': 'tester1@example.com',
+                        'first_name': 'Bob',
+                        'last_name': 'Tester'
+                    }
+                ]
+                
+                # One query for the users that already exist, one INSERT for the rest
+                users_by_username = User.objects.in_bulk(
+                    [user_data['username'] for user_data in users_data], field_name='username'
                 )
-                if created:
-                    user.set_password('password123')
-                    user.save()
-                    created_users.append(user)
-                    self.stdout.write(f'Created user: {user.username}')
-            
-            # Create test projects
-            self.stdout.write('Creating test projects...')
-            
-            projects_data = [
-                {
-                    'project_name': 'E-commerce Platform',
-                    'project_description': 'A modern e-commerce platform with payment integration',
-                    'project_owner': admin_user
-                },
-                {
-                    'project_name': 'Mobile App',
-                    'project_description': 'Cross-platform mobile application for iOS and Android',
-                    'project_owner': admin_user
-                },
-                {
-                    'project_name': 'API Gateway',
-                    'project_description': 'Microservices API gateway with authentication and rate limiting',
-                    'project_owner': created_users[0] if created_users else admin_user
+                missing_users_data = [
+                    user_data for user_data in users_data
+                    if user_data['username'] not in users_by_username
+                ]
+                
+                # Hashing is the slowest step of seeding, and the test users
+                # share one password, so each password is hashed only once
+                new_users = []
+                if missing_users_data:
+                    admin_password_hash = make_password('admin123')
+                    user_password_hash = make_password('password123')
+                    new_users = [
+                        User(
+                            password=admin_password_hash if user_data['username'] == 'admin' else user_password_hash,
+                            **user_data
+                        )
+                        for user_data in missing_users_data
+                    ]
+                
+                # Per-row progress is collected and written once per phase
+                created_lines = []
+                for user in User.objects.bulk_create(new_users):
+                    users_by_username[user.username] = user
+                    if user.username == 'admin':
+                        created_lines.append(self.style.SUCCESS('Created admin user'))
+                    else:
+                        created_lines.append(f'Created user: {user.username}')
+                self.write_progress(*created_lines)
+                
+                admin_user = users_by_username['admin']
+                developer1 = users_by_username['developer1']
+                developer2 = users_by_username['developer2']
+                tester1 = users_by_username['tester1']
+                
+                # Activity logs are collected here and inserted once at the end
+                activity_buffer = ActivityLogBuffer()
+                
+                # Create test projects
+                self.write_progress('Creating test projects...')
+                
+                projects_data = [
+                    {
+                        'project_name': 'E-commerce Platform',
+                        'project_description': 'A modern e-commerce platform with payment integration',
+                        'project_owner': admin_user
+                    },
+                    {
+                        'project_name': 'Mobile App',
+                        'project_description': 'Cross-platform mobile application for iOS and Android',
+                        'project_owner': admin_user
+                    },
+                    {
+                        'project_name': 'API Gateway',
+                        'project_description': 'Microservices API gateway with authentication and rate limiting',
+                        'project_owner': developer1
+                    }
+                ]
+                
+                projects_by_name = {
+                    project.project_name: project
+                    for project in Project.objects.filter(
+                        project_name__in=[project_data['project_name'] for project_data in projects_data]
+                    )
                 }
-            ]
-            
-            created_projects = []
-            for project_data in projects_data:
-                project, created = Project.objects.get_or_create(
-                    project_name=project_data['project_name'],
-                    defaults=project_data
-                )
-                if created:
-                    created_projects.append(project)
-                    self.stdout.write(f'Created project: {project.project_name}')
-                    
+                new_projects = Project.objects.bulk_create([
+                    Project(**project_data)
+                    for project_data in projects_data
+                    if project_data['project_name'] not in projects_by_name
+                ])
+                created_lines = []
+                for project in new_projects:
+                    projects_by_name[project.project_name] = project
+                    created_lines.append(f'Created project: {project.project_name}')
+                
                     # Create activity log for project creation
                     create_activity_log(
                         activity_type='project_created',
                         description=f"Project '{project.project_name}' was created",
                         project=project,
-                        user=project.project_owner
+                        user=project.project_owner,
+                        activity_buffer=activity_buffer
+                    )
+                
+                self.write_progress(*created_lines)
+                
+                ecommerce_project = projects_by_name['E-commerce Platform']
+                mobile_project = projects_by_name['Mobile App']
+                gateway_project = projects_by_name['API Gateway']
+                
+                # Create test bugs
+                self.write_progress('Creating test bugs...')
+                
+                bugs_data = [
+                    {
+                        'bug_title': 'Login page not responsive',
+                        'bug_description': 'The login page breaks on mobile devices with screen width less than 768px',
+                        'bug_status': 'open',
+                        'bug_priority': 'high',
+                        'related_project': ecommerce_project,
+                        'created_by_user': developer1,
+                        'assigned_to_user': developer2
+                    },
+                    {
+                        'bug_title': 'Payment gateway timeout',
+                        'bug_description': 'Users experiencing timeout errors when processing payments with PayPal',
+                        'bug_status': 'in_progress',
+                        'bug_priority': 'critical',
+                        'related_project': ecommerce_project,
+                        'created_by_user': tester1,
+                        'assigned_to_user': developer1
+                    },
+                    {
+                        'bug_title': 'App crashes on startup',
+                        'bug_description': 'Application crashes immediately after launch on Android 12 devices',
+                        'bug_status': 'resolved',
+                        'bug_priority': 'high',
+                        'related_project': mobile_project,
+                        'created_by_user': developer2,
+                        'assigned_to_user': developer1
+                    },
+                    {
+                        'bug_title': 'API rate limiting not working',
+                        'bug_description': 'Rate limiting middleware is not properly limiting requests per IP',
+                        'bug_status': 'open',
+                        'bug_priority': 'medium',
+                        'related_project': gateway_project,
+                        'created_by_user': admin_user,
+                        'assigned_to_user': developer2
+                    }
+                ]
+                
+                bugs_by_key = {
+                    (bug.related_project_id, bug.bug_title): bug
+                    for bug in Bug.objects.filter(
+                        related_project__in=[bug_data['related_project'] for bug_data in bugs_data],
+                        bug_title__in=[bug_data['bug_title'] for bug_data in bugs_data]
                     )
-            
-            # Create test bugs
-            self.stdout.write('Creating test bugs...')
-            
-            bugs_data = [
-                {
-                    'bug_title': 'Login page not responsive',
-                    'bug_description': 'The login page breaks on mobile devices with screen width less than 768px',
-                    'bug_status': 'open',
-                    'bug_priority': 'high',
-                    'related_project': created_projects[0],
-                    'created_by_user': created_users[0] if created_users else admin_user,
-                    'assigned_to_user': created_users[1] if len(created_users) > 1 else admin_user
-                },
-                {
-                    'bug_title': 'Payment gateway timeout',
-                    'bug_description': 'Users experiencing timeout errors when processing payments with PayPal',
-                    'bug_status': 'in_progress',
-                    'bug_priority': 'critical',
-                    'related_project': created_projects[0],
-                    'created_by_user': created_users[2] if len(created_users) > 2 else admin_user,
-                    'assigned_to_user': created_users[0] if created_users else admin_user
-                },
-                {
-                    'bug_title': 'App crashes on startup',
-                    'bug_description': 'Application crashes immediately after launch on Android 12 devices',
-                    'bug_status': 'resolved',
-                    'bug_priority': 'high',
-                    'related_project': created_projects[1],
-                    'created_by_user': created_users[1] if len(created_users) > 1 else admin_user,
-                    'assigned_to_user': created_users[0] if created_users else admin_user
-                },
-                {
-                    'bug_title': 'API rate limiting not working',
-                    'bug_description': 'Rate limiting middleware is not properly limiting requests per IP',
-                    'bug_status': 'open',
-                    'bug_priority': 'medium',
-                    'related_project': created_projects[2],
-                    'created_by_user': admin_user,
-                    'assigned_to_user': created_users[1] if len(created_users) > 1 else admin_user
                 }
-            ]
-            
-            created_bugs = []
-            for bug_data in bugs_data:
-                bug, created = Bug.objects.get_or_create(
-                    bug_title=bug_data['bug_title'],
-                    related_project=bug_data['related_project'],
-                    defaults=bug_data
-                )
-                if created:
-                    created_bugs.append(bug)
-                    self.stdout.write(f'Created bug: {bug.bug_title}')
-                    
+                new_bugs = Bug.objects.bulk_create([
+                    Bug(**bug_data)
+                    for bug_data in bugs_data
+                    if (bug_data['related_project'].pk, bug_data['bug_title']) not in bugs_by_key
+                ])
+                created_lines = []
+                for bug in new_bugs:
+                    bugs_by_key[(bug.related_project_id, bug.bug_title)] = bug
+                    created_lines.append(f'Created bug: {bug.bug_title}')
+                
                     # Create activity log for bug creation
                     create_activity_log(
                         activity_type='bug_created',
                         description=f"Bug '{bug.bug_title}' was created",
                         project=bug.related_project,
                         user=bug.created_by_user,
-                        bug=bug
+                        bug=bug,
+                        activity_buffer=activity_buffer
                     )
-            
-            # Create test comments
-            self.stdout.write('Creating test comments...')
-            
-            comments_data = [
-                {
-                    'comment_message': 'I can reproduce this issue on my iPhone 13. The app crashes immediately after the splash screen.',
-                    'related_bug': created_bugs[2],
-                    'commenter_user': created_users[1] if len(created_users) > 1 else admin_user
-                },
-                {
-                    'comment_message': 'This is a critical issue affecting our production environment. Please prioritize this fix.',
-                    'related_bug': created_bugs[1],
-                    'commenter_user': admin_user
-                },
-                {
-                    'comment_message': 'I\'ve started investigating the rate limiting issue. It seems to be related to the Redis configuration.',
-                    'related_bug': created_bugs[3],
-                    'commenter_user': created_users[1] if len(created_users) > 1 else admin_user
-                },
-                {
-                    'comment_message': 'The login page works fine on my end. Can you provide more details about the specific device and browser?',
-                    'related_bug': created_bugs[0],
-                    'commenter_user': created_users[0] if created_users else admin_user
-                }
-            ]
-            
-            for comment_data in comments_data:
-                comment, created = Comment.objects.get_or_create(
-                    comment_message=comment_data['comment_message'],
-                    related_bug=comment_data['related_bug'],
-                    commenter_user=comment_data['commenter_user'],
-                    defaults=comment_data
-                )
-                if created:
-                    self.stdout.write(f'Created comment on bug: {comment.related_bug.bug_title}')
-                    
+                
+                self.write_progress(*created_lines)
+                
+                seeded_bugs = [
+                    bugs_by_key[(bug_data['related_project'].pk, bug_data['bug_title'])]
+                    for bug_data in bugs_data
+                ]
+                
+                # Create test comments
+                self.write_progress('Creating test comments...')
+                
+                comments_data = [
+                    {
+                        'comment_message': 'I can reproduce this issue on my iPhone 13. The app crashes immediately after the splash screen.',
+                        'related_bug': seeded_bugs[2],
+                        'commenter_user': developer2
+                    },
+                    {
+                        'comment_message': 'This is a critical issue affecting our production environment. Please prioritize this fix.',
+                        'related_bug': seeded_bugs[1],
+                        'commenter_user': admin_user
+                    },
+                    {
+                        'comment_message': 'I\'ve started investigating the rate limiting issue. It seems to be related to the Redis configuration.',
+                        'related_bug': seeded_bugs[3],
+                        'commenter_user': developer2
+                    },
+                    {
+                        'comment_message': 'The login page works fine on my end. Can you provide more details about the specific device and browser?',
+                        'related_bug': seeded_bugs[0],
+                        'commenter_user': developer1
+                    }
+                ]
+                
+                existing_comment_keys = set(Comment.objects.filter(
+                    related_bug__in=seeded_bugs
+                ).values_list('related_bug_id', 'commenter_user_id', 'comment_message'))
+                new_comments = Comment.objects.bulk_create([
+                    Comment(**comment_data)
+                    for comment_data in comments_data
+                    if (
+                        comment_data['related_bug'].pk,
+                        comment_data['commenter_user'].pk,
+                        comment_data['comment_message']
+                    ) not in existing_comment_keys
+                ])
+                created_lines = []
+                for comment in new_comments:
+                    created_lines.append(f'Created comment on bug: {comment.related_bug.bug_title}')
+                
                     # Create activity log for comment
                     create_activity_log(
                         activity_type='comment_added',
                         description=f"Comment added to bug '{comment.related_bug.bug_title}'",
                         project=comment.related_bug.related_project,
                         user=comment.commenter_user,
-                        bug=comment.related_bug
+                        bug=comment.related_bug,
+                        activity_buffer=activity_buffer
                     )
+                
+                self.write_progress(*created_lines)
+                activity_buffer.flush()
+                
+                # bulk_create skips post_save, so drop cached project access here,
+                # once the seeded rows are visible to other connections
+                if new_projects or new_bugs:
+                    transaction.on_commit(invalidate_project_access_cache)
             
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f'Successfully seeded database with:\n'
-                    f'- {User.objects.count()} users\n'
-                    f'- {Project.objects.count()} projects\n'
-                    f'- {Bug.objects.count()} bugs\n'
-                    f'- {Comment.objects.count()} comments\n'
-                    f'- {ActivityLog.objects.count()} activity logs'
+            # The summary costs a COUNT per table, so quiet runs skip it
+            if not self.quiet:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f'Successfully seeded database with:\n'
+                        f'- {User.objects.count()} users\n'
+                        f'- {Project.objects.count()} projects\n'
+                        f'- {Bug.objects.count()} bugs\n'
+                        f'- {Comment.objects.count()} comments\n'
+                        f'- {ActivityLog.objects.count()} activity logs'
+                    )
                 )
-            )
             
         except Exception as e:
             self.stdout.write(
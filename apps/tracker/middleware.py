@@ -0,0 +1,42 @@
+"""
+Middleware for the tracker application.
+"""
+
+from django.db import transaction
+from .services import ActivityLogBuffer, current_activity_buffer
+import logging
+
+logger = logging.getLogger('tracker.services')
+
+
+class ActivityLogBufferMiddleware:
+    """
+    Open an ActivityLogBuffer for each request and bulk insert the activity
+    logs it collected once the response is ready and the data is committed.
+    
+    The buffer is published through current_activity_buffer, so every
+    create_activity_log call made while handling the request is batched
+    without the buffer being passed around.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        activity_log_buffer = ActivityLogBuffer()
+        buffer_token = current_activity_buffer.set(activity_log_buffer)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_activity_buffer.reset(buffer_token)
+        
+        transaction.on_commit(lambda: self.flush_activity_logs(activity_log_buffer))
+        return response
+
+    @staticmethod
+    def flush_activity_logs(activity_log_buffer):
+        """Insert buffered activity logs without failing the response"""
+        try:
+            activity_log_buffer.flush()
+        except Exception as e:
+            logger.error("Failed to flush buffered activity logs: %s", e)
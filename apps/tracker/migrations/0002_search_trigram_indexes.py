@@ -0,0 +1,52 @@
+"""
+Trigram indexes backing the API search fields on PostgreSQL.
+
+DRF's SearchFilter issues icontains lookups, which PostgreSQL compiles to
+UPPER("column"::text) LIKE UPPER('%term%'). A GIN index over that same
+expression with gin_trgm_ops lets the planner answer the LIKE from the index
+instead of scanning the table. Other database backends are left untouched.
+"""
+
+from django.db import migrations
+
+
+# (index name, table, column) for every column listed in a viewset's search_fields
+SEARCH_TRIGRAM_INDEXES = [
+    ('tracker_project_name_trgm', 'tracker_project', 'project_name'),
+    ('tracker_project_description_trgm', 'tracker_project', 'project_description'),
+    ('tracker_bug_title_trgm', 'tracker_bug', 'bug_title'),
+    ('tracker_bug_description_trgm', 'tracker_bug', 'bug_description'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Create the pg_trgm extension and search indexes on PostgreSQL only"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, table_name, column_name in SEARCH_TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} '
+            f'USING gin ((UPPER({column_name}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """Drop the search indexes, leaving the extension in place"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for index_name, _table_name, _column_name in SEARCH_TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -7,7 +7,69 @@ import logging
 logger = logging.getLogger('tracker.models')
 
 
-class Project(models.Model):
+class AccessFieldTrackingMixin:
+    """
+    Remember the access-deciding foreign keys a row was loaded with.
+    
+    The signal handlers compare against these values to invalidate cached
+    project access only when ownership or bug involvement actually changes.
+    """
+    # Attribute names of the fields that decide who can access a project
+    access_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_access_fields()
+        return instance
+
+    def remember_access_fields(self):
+        """Record the current access field values as the saved state"""
+        # Read from __dict__ so deferred fields are not fetched here
+        self._loaded_access_fields = {
+            field_name: self.__dict__.get(field_name) for field_name in self.access_fields
+        }
+
+    def access_fields_changed(self):
+        """Check whether an access field differs from the saved state"""
+        loaded_access_fields = getattr(self, '_loaded_access_fields', None)
+        if loaded_access_fields is None:
+            return True
+        return any(
+            self.__dict__.get(field_name) != loaded_value
+            for field_name, loaded_value in loaded_access_fields.items()
+        )
+
+
+class ProjectQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for projects.
+    """
+    def with_counts(self):
+        """
+        Annotate total and open bug counts in the same GROUP BY query.
+        
+        The annotations back total_bugs_count and open_bugs_count, so reading
+        those properties on the results does not issue a COUNT per project.
+        """
+        return self.annotate(
+            _total_bugs=models.Count('project_bugs'),
+            _open_bugs=models.Count('project_bugs', filter=models.Q(project_bugs__bug_status='open'))
+        )
+
+
+class BugQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for bugs.
+    """
+    def with_counts(self):
+        """
+        Annotate the comment count backing comments_count in the same query.
+        """
+        return self.annotate(_comments_count=models.Count('bug_comments'))
+
+
+class Project(AccessFieldTrackingMixin, models.Model):
     """
     Represents a project in the bug tracking system.
     Each project has an owner and can contain multiple bugs.
@@ -23,6 +85,10 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProjectQuerySet.as_manager()
+    
+    access_fields = ('project_owner_id',)
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Project"
@@ -36,19 +102,28 @@ class Project(models.Model):
         is_new_project = self.pk is None
         super().save(*args, **kwargs)
         
-        if is_new_project:
-            logger.info(f"New project created: {self.project_name} by {self.project_owner.username}")
-        else:
-            logger.info(f"Project updated: {self.project_name} by {self.project_owner.username}")
+        # Guarded so the owner lookup only runs when the message is emitted
+        if logger.isEnabledFor(logging.INFO):
+            if is_new_project:
+                logger.info("New project created: %s by %s", self.project_name, self.project_owner.username)
+            else:
+                logger.info("Project updated: %s by %s", self.project_name, self.project_owner.username)
 
     @property
     def total_bugs_count(self):
         """Get total number of bugs in this project"""
+        # Prefer the value annotated by the queryset to avoid a COUNT per row
+        annotated_count = getattr(self, '_total_bugs', None)
+        if annotated_count is not None:
+            return annotated_count
         return self.project_bugs.count()
 
     @property
     def open_bugs_count(self):
         """Get number of open bugs in this project"""
+        annotated_count = getattr(self, '_open_bugs', None)
+        if annotated_count is not None:
+            return annotated_count
         return self.project_bugs.filter(bug_status='open').count()
 
     # TODO: Add project archiving functionality
@@ -56,7 +131,7 @@ class Project(models.Model):
     # TODO: Add project templates for quick setup
 
 
-class Bug(models.Model):
+class Bug(AccessFieldTrackingMixin, models.Model):
     """
     Represents a bug in the tracking system.
     Each bug belongs to a project and can be assigned to a user.
@@ -112,40 +187,67 @@ class Bug(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BugQuerySet.as_manager()
+    
+    access_fields = ('related_project_id', 'assigned_to_user_id', 'created_by_user_id')
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Bug"
         verbose_name_plural = "Bugs"
+        indexes = [
+            models.Index(fields=['related_project', '-created_at'], name='bug_project_created_idx'),
+            models.Index(fields=['assigned_to_user', '-created_at'], name='bug_assignee_created_idx'),
+            models.Index(fields=['created_by_user', '-created_at'], name='bug_creator_created_idx'),
+            models.Index(fields=['bug_status', '-created_at'], name='bug_status_created_idx'),
+            models.Index(fields=['related_project', 'bug_status'], name='bug_project_status_idx'),
+            models.Index(fields=['assigned_to_user', 'bug_status'], name='bug_assignee_status_idx'),
+            # Unfiltered GET /api/bugs/ pages through all bugs in default ordering
+            models.Index(fields=['-created_at'], name='bug_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.bug_title} [{self.bug_status}] ({self.related_project.project_name})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the status the bug was loaded with for change detection"""
+        instance = super().from_db(db, field_names, values)
+        # Read from __dict__ so a deferred status is not fetched here
+        instance._loaded_status = instance.__dict__.get('bug_status')
+        return instance
+
     def save(self, *args, **kwargs):
         """Override save method to log bug changes and status updates"""
         is_new_bug = self.pk is None
-        old_status = None
+        # Compare against the status tracked in from_db instead of re-reading the row
+        old_status = getattr(self, '_loaded_status', None)
         
-        if not is_new_bug:
-            # Get the old status before saving for comparison
-            try:
-                existing_bug = Bug.objects.get(pk=self.pk)
-                old_status = existing_bug.bug_status
-            except Bug.DoesNotExist:
-                pass
+        update_fields = kwargs.get('update_fields')
+        if (not is_new_bug and old_status is None and
+                (update_fields is None or 'bug_status' in update_fields)):
+            # Not loaded with its status (built with a pk, or the status was
+            # deferred): read just that column rather than the whole row
+            old_status = Bug.objects.filter(pk=self.pk).values_list('bug_status', flat=True).first()
         
         super().save(*args, **kwargs)
+        self._loaded_status = self.__dict__.get('bug_status')
         
         if is_new_bug:
-            logger.info(f"New bug created: {self.bug_title} in project {self.related_project.project_name}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("New bug created: %s in project %s", self.bug_title, self.related_project.project_name)
         else:
             if old_status and old_status != self.bug_status:
-                logger.info(f"Bug status changed: {self.bug_title} from {old_status} to {self.bug_status}")
+                logger.info("Bug status changed: %s from %s to %s", self.bug_title, old_status, self.bug_status)
             else:
-                logger.info(f"Bug updated: {self.bug_title}")
+                logger.info("Bug updated: %s", self.bug_title)
 
     @property
     def comments_count(self):
         """Get total number of comments on this bug"""
+        annotated_count = getattr(self, '_comments_count', None)
+        if annotated_count is not None:
+            return annotated_count
         return self.bug_comments.count()
 
     def is_assigned_to_user(self, user):
@@ -188,6 +290,9 @@ class Comment(models.Model):
         ordering = ['created_at']
         verbose_name = "Comment"
         verbose_name_plural = "Comments"
+        indexes = [
+            models.Index(fields=['related_bug', 'created_at'], name='comment_bug_created_idx'),
+        ]
 
     def __str__(self):
         return f"Comment by {self.commenter_user.username} on {self.related_bug.bug_title}"
@@ -197,10 +302,12 @@ class Comment(models.Model):
         is_new_comment = self.pk is None
         super().save(*args, **kwargs)
         
-        if is_new_comment:
-            logger.info(f"New comment added by {self.commenter_user.username} on bug: {self.related_bug.bug_title}")
-        else:
-            logger.info(f"Comment updated by {self.commenter_user.username} on bug: {self.related_bug.bug_title}")
+        # Guarded so the user and bug lookups only run when the message is emitted
+        if logger.isEnabledFor(logging.INFO):
+            if is_new_comment:
+                logger.info("New comment added by %s on bug: %s", self.commenter_user.username, self.related_bug.bug_title)
+            else:
+                logger.info("Comment updated by %s on bug: %s", self.commenter_user.username, self.related_bug.bug_title)
 
     def can_user_edit(self, user):
         """Check if user has permission to edit this comment"""
@@ -254,6 +361,10 @@ class ActivityLog(models.Model):
         ordering = ['-created_at']
         verbose_name = "Activity Log"
         verbose_name_plural = "Activity Logs"
+        indexes = [
+            models.Index(fields=['related_project', '-created_at'], name='activity_project_created_idx'),
+            models.Index(fields=['activity_type', '-created_at'], name='activity_type_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.activity_type}: {self.activity_description} by {self.activity_user.username}"
@@ -261,7 +372,9 @@ class ActivityLog(models.Model):
     def save(self, *args, **kwargs):
         """Override save method to log activity creation"""
         super().save(*args, **kwargs)
-        logger.info(f"Activity logged: {self.activity_type} - {self.activity_description}")
+        # Highest-volume write in the app: a short DEBUG record with the row id
+        # rather than the full description at INFO
+        logger.debug("Activity logged: %s (id %s)", self.activity_type, self.pk)
 
     @classmethod
     def log_activity(cls, activity_type, description, project, user, bug=None):
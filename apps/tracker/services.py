@@ -3,29 +3,113 @@ Services module for the tracker application.
 Contains business logic and data abstractions.
 """
 
+from contextvars import ContextVar
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q
 from .models import Project, Bug, Comment, ActivityLog
 import logging
+import time
 
 logger = logging.getLogger('tracker.services')
 
+# Cross-request cache of accessible project ids, keyed by user and access version
+ACCESSIBLE_PROJECTS_CACHE_TIMEOUT = 60
+PROJECT_ACCESS_VERSION_KEY = 'accessible_projects:version'
+
+# Allowed bug status changes, keyed by the current status
+VALID_STATUS_TRANSITIONS = {
+    'open': frozenset({'in_progress', 'resolved'}),
+    'in_progress': frozenset({'open', 'resolved'}),
+    'resolved': frozenset({'open', 'in_progress'}),
+}
+
+# ActivityLogBuffer of the request being handled, set by ActivityLogBufferMiddleware
+current_activity_buffer = ContextVar('current_activity_buffer', default=None)
+
 
 def get_user_accessible_projects(user):
     """
     Get all projects that a user has access to.
     
+    The result is memoized on the user object and the project ids are cached
+    across requests for a short TTL, both under the current access version
+    (see invalidate_project_access_cache).
+    
+    Every call reads the access version from the cache first, even when the
+    memo answers, because a stale version is how invalidation is noticed.
+    The API views call this once per request, so a request costs one cache
+    round trip for the version plus one for the ids, and a query only when
+    the ids are not cached.
+    
     Args:
         user: Django User instance
         
     Returns:
         QuerySet: Projects the user can access
     """
-    return Project.objects.filter(
-        Q(project_owner=user) |
-        Q(project_bugs__assigned_to_user=user) |
-        Q(project_bugs__created_by_user=user)
-    ).distinct()
+    access_version = get_project_access_version()
+    
+    # User objects can outlive a request, so the memo is tied to the version
+    memoized = getattr(user, '_accessible_projects_cache', None)
+    if memoized is not None and memoized[0] == access_version:
+        return memoized[1]
+    
+    cache_key = f"accessible_projects:{user.pk}:{access_version}"
+    project_ids = cache.get(cache_key)
+    if project_ids is None:
+        project_ids = list(Project.objects.filter(
+            project_access_condition(user)
+        ).values_list('id', flat=True))
+        cache.set(cache_key, project_ids, ACCESSIBLE_PROJECTS_CACHE_TIMEOUT)
+    
+    accessible_projects = Project.objects.filter(id__in=project_ids)
+    user._accessible_projects_cache = (access_version, accessible_projects)
+    return accessible_projects
+
+
+def project_access_condition(user):
+    """
+    Build the filter matching projects a user can access.
+    
+    Users can access projects they own or that have a bug assigned to or
+    created by them. The bug check is a correlated EXISTS rather than a
+    join, so matching projects come back once without DISTINCT.
+    
+    Args:
+        user: Django User instance
+        
+    Returns:
+        Q: Condition to pass to Project.objects.filter()
+    """
+    involved_bugs = Bug.objects.filter(related_project=OuterRef('pk')).filter(
+        Q(assigned_to_user=user) | Q(created_by_user=user)
+    )
+    return Q(project_owner=user) | Q(Exists(involved_bugs))
+
+
+def get_project_access_version():
+    """
+    Get the current project access version used in access cache keys.
+    
+    Returns:
+        int: Current access version
+    """
+    # A time-based initial value keeps a re-created version from colliding
+    # with keys cached under an evicted one
+    return cache.get_or_set(PROJECT_ACCESS_VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_project_access_cache():
+    """
+    Invalidate all cached project access by bumping the access version.
+    Called whenever project ownership or bug involvement may have changed.
+    """
+    try:
+        cache.incr(PROJECT_ACCESS_VERSION_KEY)
+    except ValueError:
+        cache.set(PROJECT_ACCESS_VERSION_KEY, time.time_ns(), None)
 
 
 def get_bug_notification_recipients(bug):
@@ -38,61 +122,119 @@ def get_bug_notification_recipients(bug):
     Returns:
         list: User IDs to notify
     """
-    recipients = []
-    
-    # Add bug creator
-    if bug.created_by_user:
-        recipients.append(bug.created_by_user.id)
-    
-    # Add assigned user
-    if bug.assigned_to_user:
-        recipients.append(bug.assigned_to_user.id)
+    # Read the foreign key ids directly so no user rows are fetched; only the
+    # project is loaded, unless the bug came with select_related
+    recipients = [
+        bug.created_by_user_id,
+        bug.assigned_to_user_id,
+        bug.related_project.project_owner_id,
+    ]
     
-    # Add project owner
-    recipients.append(bug.related_project.project_owner.id)
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_recipients = []
-    for user_id in recipients:
-        if user_id not in seen:
-            seen.add(user_id)
-            unique_recipients.append(user_id)
-    
-    return unique_recipients
+    # Remove duplicates while preserving order, skipping an unassigned bug
+    return [user_id for user_id in dict.fromkeys(recipients) if user_id is not None]
 
 
-def create_activity_log(activity_type, description, project, user, bug=None):
+def create_activity_log(activity_type, description, project, user, bug=None, activity_buffer=None):
     """
     Create an activity log entry with proper error handling.
     
+    The INSERT never runs inside the caller's write transaction: the entry
+    is queued on the activity buffer when there is one, and otherwise saved
+    once the current transaction commits (immediately in autocommit).
+    
     Args:
         activity_type: Type of activity from ActivityLog.ACTIVITY_TYPES
         description: Description of the activity
         project: Related project
         user: User who performed the activity
         bug: Related bug (optional)
+        activity_buffer: ActivityLogBuffer to defer the INSERT to (optional,
+            defaults to the buffer of the current request)
         
     Returns:
-        ActivityLog: Created activity log instance or None if failed
+        ActivityLog: Activity log instance, unsaved until it is flushed or the
+            transaction commits, or None if failed
     """
     try:
-        return ActivityLog.log_activity(
+        activity_log = ActivityLog(
             activity_type=activity_type,
-            description=description,
-            project=project,
-            user=user,
-            bug=bug
+            activity_description=description,
+            related_project=project,
+            activity_user=user,
+            related_bug=bug
         )
+        
+        if activity_buffer is None:
+            activity_buffer = current_activity_buffer.get()
+        
+        if activity_buffer is not None:
+            return activity_buffer.add(activity_log)
+        
+        # robust=True logs a failed INSERT instead of raising into the commit
+        transaction.on_commit(activity_log.save, robust=True)
+        return activity_log
     except Exception as e:
         logger.error(f"Failed to create activity log: {str(e)}")
         return None
 
 
+class ActivityLogBuffer:
+    """
+    Collects unsaved ActivityLog instances and inserts them with a single
+    bulk_create when flushed. ActivityLogBufferMiddleware opens one buffer
+    per request and publishes it as current_activity_buffer.
+    """
+    batch_size = 500
+
+    def __init__(self):
+        self.pending_activities = []
+
+    def add(self, activity_log):
+        """
+        Queue an unsaved activity log for the next flush. A full batch is
+        inserted right away so large runs do not hold every row in memory.
+        
+        Args:
+            activity_log: Unsaved ActivityLog instance
+            
+        Returns:
+            ActivityLog: The queued instance
+        """
+        self.pending_activities.append(activity_log)
+        if len(self.pending_activities) >= self.batch_size:
+            self.flush()
+        return activity_log
+
+    def flush(self):
+        """
+        Insert all queued activity logs and empty the buffer.
+        
+        Returns:
+            list: Created ActivityLog instances
+        """
+        if not self.pending_activities:
+            return []
+        
+        pending_activities, self.pending_activities = self.pending_activities, []
+        
+        # A lone row is a plain INSERT either way; save() also avoids the
+        # transaction bulk_create opens around its batches
+        if len(pending_activities) == 1:
+            pending_activities[0].save()
+            return pending_activities
+        
+        created_activities = ActivityLog.objects.bulk_create(pending_activities, batch_size=self.batch_size)
+        logger.info("Flushed %s buffered activity logs", len(created_activities))
+        return created_activities
+
+
 def get_user_bugs(user, filters=None):
     """
     Get bugs for a user with optional filtering.
     
+    Comments are not loaded; each bug carries an annotated comment count
+    instead.
+    
     Args:
         user: Django User instance
         filters: Optional dict of filters to apply
@@ -102,7 +244,7 @@ def get_user_bugs(user, filters=None):
     """
     queryset = Bug.objects.select_related(
         'assigned_to_user', 'created_by_user', 'related_project'
-    ).prefetch_related('bug_comments')
+    ).with_counts()
     
     if filters:
         if filters.get('status'):
@@ -126,13 +268,10 @@ def can_user_access_project(user, project_id):
     Returns:
         bool: True if user has access, False otherwise
     """
-    try:
-        project = Project.objects.get(id=project_id)
-        return (project.project_owner == user or
-                project.project_bugs.filter(assigned_to_user=user).exists() or
-                project.project_bugs.filter(created_by_user=user).exists())
-    except Project.DoesNotExist:
-        return False
+    # A missing project simply matches nothing
+    return Project.objects.filter(id=project_id).filter(
+        project_access_condition(user)
+    ).exists()
 
 
 def validate_bug_status_transition(old_status, new_status):
@@ -146,13 +285,7 @@ def validate_bug_status_transition(old_status, new_status):
     Returns:
         bool: True if transition is valid, False otherwise
     """
-    valid_transitions = {
-        'open': ['in_progress', 'resolved'],
-        'in_progress': ['open', 'resolved'],
-        'resolved': ['open', 'in_progress']
-    }
-    
-    return new_status in valid_transitions.get(old_status, [])
+    return new_status in VALID_STATUS_TRANSITIONS.get(old_status, frozenset())
 
 
 def get_project_statistics(project):
@@ -165,15 +298,14 @@ def get_project_statistics(project):
     Returns:
         dict: Project statistics
     """
-    bugs = project.project_bugs.all()
-    
-    return {
-        'total_bugs': bugs.count(),
-        'open_bugs': bugs.filter(bug_status='open').count(),
-        'in_progress_bugs': bugs.filter(bug_status='in_progress').count(),
-        'resolved_bugs': bugs.filter(bug_status='resolved').count(),
-        'high_priority_bugs': bugs.filter(bug_priority__in=['high', 'critical']).count(),
-    }
+    # One query with conditional counts instead of a COUNT per statistic
+    return project.project_bugs.aggregate(
+        total_bugs=Count('id'),
+        open_bugs=Count('id', filter=Q(bug_status='open')),
+        in_progress_bugs=Count('id', filter=Q(bug_status='in_progress')),
+        resolved_bugs=Count('id', filter=Q(bug_status='resolved')),
+        high_priority_bugs=Count('id', filter=Q(bug_priority__in=['high', 'critical'])),
+    )
 
 
 def format_error_message(error, context=None):
@@ -187,12 +319,10 @@ def format_error_message(error, context=None):
     Returns:
         str: Formatted error message
     """
-    if isinstance(error, Exception):
-        error_msg = str(error)
-    else:
-        error_msg = error
+    # str() covers both exceptions and plain messages (a str is returned as is)
+    error_msg = str(error)
     
     if context:
-        return f"{error_msg} (Context: {context})"
+        return error_msg + " (Context: " + str(context) + ")"
     
     return error_msg 
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+Signal handlers for the tracker application.
+Keeps cached access decisions in sync with project and bug changes.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Project, Bug
+from .services import invalidate_project_access_cache
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Bug)
+def invalidate_access_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Drop cached project access when a save changes ownership or bug involvement.
+    Edits that leave the access fields alone, such as status or title
+    changes, keep the cache.
+    """
+    if not created and update_fields is not None:
+        # update_fields may name a foreign key either way, e.g. project_owner or project_owner_id
+        access_field_names = {
+            name for field_name in sender.access_fields
+            for name in (field_name, sender._meta.get_field(field_name).name)
+        }
+        if not access_field_names.intersection(update_fields):
+            return
+
+    if created or instance.access_fields_changed():
+        # Bump once the data is committed so other workers cannot re-cache the old state
+        transaction.on_commit(invalidate_project_access_cache)
+    instance.remember_access_fields()
+
+
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Bug)
+def invalidate_access_on_delete(sender, **kwargs):
+    """Drop cached project access once a deleted project or bug is committed"""
+    transaction.on_commit(invalidate_project_access_cache)
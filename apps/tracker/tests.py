@@ -0,0 +1,55 @@
+"""
+Tests for the tracker application.
+"""
+
+import asyncio
+
+from django.test import SimpleTestCase
+
+from .consumers import TrackerConsumer
+
+
+class QueuedSendCloseTests(SimpleTestCase):
+    """Frames queued before close() reach the client ahead of the close"""
+
+    async def make_consumer(self, transport_delay=0):
+        consumer = TrackerConsumer()
+        sent_messages = []
+
+        async def base_send(message):
+            if message['type'] == 'websocket.send':
+                # Yield like a real transport so close() can run mid-batch
+                await asyncio.sleep(transport_delay)
+            sent_messages.append(message)
+
+        consumer.base_send = base_send
+        await consumer.accept()
+        return consumer, sent_messages
+
+    async def test_close_sends_queued_frames_in_order_first(self):
+        consumer, sent_messages = await self.make_consumer(transport_delay=0.001)
+        for index in range(5):
+            await consumer.send(text_data=str(index))
+        # Let the writer pick up the batch and start writing it
+        await asyncio.sleep(0)
+
+        await consumer.close(code=1000)
+
+        self.assertEqual(
+            [message.get('text', message['type']) for message in sent_messages],
+            ['websocket.accept', '0', '1', '2', '3', '4', 'websocket.close'],
+        )
+        self.assertEqual(sent_messages[-1]['code'], 1000)
+        self.assertIsNone(consumer.writer_task)
+
+    async def test_send_after_close_is_dropped(self):
+        consumer, sent_messages = await self.make_consumer()
+        await consumer.send(text_data='before')
+        await consumer.close()
+        await consumer.send(text_data='after')
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(
+            [message.get('text', message['type']) for message in sent_messages],
+            ['websocket.accept', 'before', 'websocket.close'],
+        )
@@ -1,11 +1,22 @@
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
+from functools import lru_cache
 import json
 import logging
+import orjson
 
 # Set up logging for WebSocket utilities
 logger = logging.getLogger('tracker.websocket')
 
+# Message types clients may send
+VALID_MESSAGE_TYPES = frozenset({
+    'join_project_room',
+    'leave_project_room',
+    'typing_start',
+    'typing_stop',
+    'ping',
+})
+
 
 def send_websocket_notification(project_id, notification_type, notification_data):
     """
@@ -32,10 +43,10 @@ def send_websocket_notification(project_id, notification_type, notification_data
             notification_message
         )
         
-        logger.info(f"WebSocket notification sent to project {project_id}: {notification_type}")
+        logger.info("WebSocket notification sent to project %s: %s", project_id, notification_type)
         
     except Exception as e:
-        logger.error(f"Failed to send WebSocket notification to project {project_id}: {str(e)}")
+        logger.error("Failed to send WebSocket notification to project %s: %s", project_id, e)
 
 
 def send_typing_indicator(project_id, user_id, username, is_typing):
@@ -66,10 +77,10 @@ def send_typing_indicator(project_id, user_id, username, is_typing):
         )
         
         action = "started" if is_typing else "stopped"
-        logger.info(f"Typing indicator sent to project {project_id}: {username} {action} typing")
+        logger.info("Typing indicator sent to project %s: %s %s typing", project_id, username, action)
         
     except Exception as e:
-        logger.error(f"Failed to send typing indicator to project {project_id}: {str(e)}")
+        logger.error("Failed to send typing indicator to project %s: %s", project_id, e)
 
 
 def send_activity_stream(project_id, activity_data):
@@ -96,12 +107,13 @@ def send_activity_stream(project_id, activity_data):
         )
         
         activity_type = activity_data.get('activity_type', 'unknown')
-        logger.info(f"Activity stream update sent to project {project_id}: {activity_type}")
+        logger.info("Activity stream update sent to project %s: %s", project_id, activity_type)
         
     except Exception as e:
-        logger.error(f"Failed to send activity stream to project {project_id}: {str(e)}")
+        logger.error("Failed to send activity stream to project %s: %s", project_id, e)
 
 
+@lru_cache(maxsize=4096)
 def get_project_room_name(project_id):
     """
     Get the standardized room name for a project.
@@ -115,6 +127,26 @@ def get_project_room_name(project_id):
     return f"project_{project_id}"
 
 
+def decode_websocket_message(text_data):
+    """
+    Parse and validate an incoming WebSocket frame in one step.
+    
+    Args:
+        text_data (str): Raw text frame received from the client
+        
+    Returns:
+        tuple: (message_data, error_message); message_data is None when invalid
+        
+    Raises:
+        orjson.JSONDecodeError: If the frame is not valid JSON
+    """
+    message_data = orjson.loads(text_data)
+    is_valid, error_message = validate_websocket_message(message_data)
+    if not is_valid:
+        return None, error_message
+    return message_data, None
+
+
 def validate_websocket_message(message_data):
     """
     Validate incoming WebSocket message data.
@@ -125,32 +157,18 @@ def validate_websocket_message(message_data):
     Returns:
         tuple: (is_valid, error_message)
     """
-    try:
-        required_fields = ['type']
-        
-        if not isinstance(message_data, dict):
-            return False, "Message data must be a dictionary"
-        
-        for field in required_fields:
-            if field not in message_data:
-                return False, f"Missing required field: {field}"
-        
-        valid_message_types = [
-            'join_project_room',
-            'leave_project_room',
-            'typing_start',
-            'typing_stop',
-            'ping'
-        ]
-        
-        if message_data['type'] not in valid_message_types:
-            return False, f"Invalid message type: {message_data['type']}"
-        
-        return True, None
-        
-    except Exception as e:
-        logger.error(f"Error validating WebSocket message: {str(e)}")
-        return False, f"Validation error: {str(e)}"
+    if type(message_data) is not dict:
+        return False, "Message data must be a dictionary"
+    
+    if 'type' not in message_data:
+        return False, "Missing required field: type"
+    
+    message_type = message_data['type']
+    # Only strings can be valid; this also keeps unhashable values out of the set lookup
+    if type(message_type) is not str or message_type not in VALID_MESSAGE_TYPES:
+        return False, f"Invalid message type: {message_type}"
+    
+    return True, None
 
 
 # TODO: Add WebSocket connection rate limiting
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 from datetime import timedelta
 import os
+from urllib.parse import urlsplit
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -73,6 +74,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'apps.tracker.middleware.ActivityLogBufferMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -170,6 +172,10 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'apps.tracker.api.v1.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
@@ -207,6 +213,25 @@ SIMPLE_JWT = {
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
 
+# Cache (Redis when REDIS_URL is set, shared by every worker so cached access
+# decisions and their invalidation are seen by all of them; db 1 keeps cache
+# keys apart from db 0. Without REDIS_URL, e.g. local dev, a per-process
+# LocMem cache is used.)
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': urlsplit(REDIS_URL)._replace(path='/1').geturl(),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # Channels Configuration
 ASGI_APPLICATION = 'config.asgi.application'
 
@@ -216,6 +241,9 @@ CHANNEL_LAYERS = {
         'BACKEND': 'channels_redis.core.RedisChannelLayer',
         'CONFIG': {
             "hosts": [('127.0.0.1', 6379)],
+            # Group events travel as msgpack; kept explicit so the compact
+            # binary format does not depend on the library default
+            "serializer_format": "msgpack",
         },
     },
 }
@@ -287,6 +315,13 @@ LOGGING = {
     },
 }
 
+# The handlers of the tracker.* loggers above are moved behind a QueueHandler
+# at startup (see apps.tracker.logging_queue), so file writes happen on a
+# background thread rather than in the request path.
+
+# Production logging (uncomment for production)
+# LOGGING['loggers']['tracker.api']['level'] = 'WARNING'
+
 # DRF Spectacular settings
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Bug Tracker API',